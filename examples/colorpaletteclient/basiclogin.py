@@ -2,15 +2,20 @@
 # SPDX-License-Identifier: LicenseRef-Qt-Commercial OR BSD-3-Clause
 
 
-import sys
+import logging
 from dataclasses import dataclass
 from typing import Optional, Any
 
 from abstractresource import AbstractResource
 
 
-@dataclass
+logger = logging.getLogger(__name__)
+
+
+@dataclass(frozen=True)
 class User:
+    __slots__ = ("email", "token", "id")
+
     email: str
     token: str
     id: int
@@ -22,12 +27,15 @@ class BasicLogin(AbstractResource):
     def __init__(self) -> None:
         super().__init__()
         self._user: Optional[User] = None
+        # Values read by QML bindings, refreshed only on login/logout
+        self._user_email: str = ""
+        self._logged_in: bool = False
         self._login_path: str = ""
         self._logout_path: str = ""
 
     @property
     def user(self) -> str:
-        return self._user.email if self._user else ""
+        return self._user_email
 
     @user.setter
     def user(self, value: str) -> None:
@@ -38,7 +46,7 @@ class BasicLogin(AbstractResource):
 
     @property
     def loggedIn(self) -> bool:
-        return bool(self._user)
+        return self._logged_in
 
     @loggedIn.setter
     def loggedIn(self, value: bool) -> None:
@@ -63,6 +71,11 @@ class BasicLogin(AbstractResource):
     def logoutPath(self, path: str) -> None:
         self._logout_path = path
 
+    def _set_user(self, user: Optional[User]) -> None:
+        self._user = user
+        self._user_email = user.email if user else ""
+        self._logged_in = user is not None
+
     def login(self, data: dict[str, Any]) -> bool:
         """Perform login with provided credentials
 
@@ -70,7 +83,7 @@ class BasicLogin(AbstractResource):
         QML should re-read user and loggedIn properties after this returns True.
         """
         if not self._service:
-            print("No service configured for login", file=sys.stderr)
+            logger.error("No service configured for login")
             return False
 
         try:
@@ -80,17 +93,17 @@ class BasicLogin(AbstractResource):
                 if token:
                     email = data.get("email", "")
                     user_id = response.get("id", data.get("id", 0))
-                    self._user = User(email=email, token=token, id=user_id)
+                    self._set_user(User(email=email, token=token, id=user_id))
                     # Set auth token for future requests
                     self._service.set_auth_token(token)
-                    print(f"Login successful for {email}")
+                    logger.debug("Login successful for %s", email)
                     return True
                 else:
-                    print("Login failed: No token received", file=sys.stderr)
+                    logger.error("Login failed: No token received")
             else:
-                print("Login failed: Empty response", file=sys.stderr)
+                logger.error("Login failed: Empty response")
         except Exception as e:
-            print(f"Login error: {e}", file=sys.stderr)
+            logger.error("Login error: %s", e)
 
         return False
 
@@ -101,16 +114,16 @@ class BasicLogin(AbstractResource):
         QML should re-read user and loggedIn properties after this returns True.
         """
         if not self._service:
-            print("No service configured for logout", file=sys.stderr)
+            logger.error("No service configured for logout")
             return False
 
         try:
             response = self._service.post(self._logout_path, {})
-            self._user = None
+            self._set_user(None)
             # Clear auth token
             self._service.set_auth_token("")
-            print("Logout successful")
+            logger.debug("Logout successful")
             return True
         except Exception as e:
-            print(f"Logout error: {e}", file=sys.stderr)
+            logger.error("Logout error: %s", e)
             return False
@@ -2,69 +2,91 @@
 # SPDX-License-Identifier: LicenseRef-Qt-Commercial OR BSD-3-Clause
 
 
-import sys
+import logging
+from concurrent.futures import Future
 from dataclasses import dataclass
-from typing import List, Dict, Any, Optional
+from typing import Callable, List, Dict, Any, Optional
 from urllib.parse import urlencode
 
 from QtBridge import reset, bridge_instance
 from abstractresource import AbstractResource
 
 
-@dataclass
+logger = logging.getLogger(__name__)
+
+
+@dataclass(frozen=True)
 class ColorUser:
+    __slots__ = ("id", "email", "avatar")
+
     id: int
     email: str
     avatar: str  # URL
 
 
-@dataclass
+@dataclass(frozen=True)
 class Color:
+    __slots__ = ("color_id", "color", "name", "pantone_value")
+
     color_id: int
     color: str
     name: str
     pantone_value: str
 
 
+def _color_user_from_json(item: dict[str, Any]) -> ColorUser:
+    return ColorUser(int(item["id"]), item["email"], item["avatar"])
+
+
+def _color_from_json(item: dict[str, Any]) -> Color:
+    # Handle both 'id' (reqres.in) and 'color_id' (FastAPI server)
+    return Color(int(item.get("color_id") or item.get("id")), item["color"],
+                 item["name"], item["pantone_value"])
+
+
+def _parse_rows(json_list: list[dict[str, Any]],
+                parse: Callable[[dict[str, Any]], Any], kind: str) -> list[Any]:
+    """Convert JSON items into records, skipping malformed ones"""
+    try:
+        return [parse(item) for item in json_list]
+    except (KeyError, ValueError):
+        pass
+    # Slow path: parse row by row so one bad item doesn't drop the whole page
+    rows = []
+    for item in json_list:
+        try:
+            rows.append(parse(item))
+        except (KeyError, ValueError) as e:
+            logger.error("Error parsing %s data: %s", kind, e)
+    return rows
+
+
 class ColorUserModel:
     """Model for color users that QML can use as a list model"""
 
     def __init__(self) -> None:
         self._users: list[ColorUser] = []
+        self._avatar_by_email: dict[str, str] = {}
 
     def data(self) -> list[ColorUser]:
         """Return the main data list that BridgePyTypeObjectModel will expose to QML"""
-        print("ColorUserModel data requested with", len(self._users), "users")
         return self._users
 
     def clear(self) -> None:
         """Clear all users"""
         self._users.clear()
+        self._avatar_by_email.clear()
 
     @reset
     def set_data(self, json_list: list[dict[str, Any]]) -> None:
         """Set users from JSON data using @reset decorator for proper model updates"""
-        print("ColorUserModel set_data called with", len(json_list), "users")
-        self._users.clear()
-        for item in json_list:
-            print("Processing user item:", item)
-            try:
-                user = ColorUser(
-                    id=int(item["id"]),
-                    email=item["email"],
-                    avatar=item["avatar"]
-                )
-                self._users.append(user)
-                print(f"Added user: {user.email}")
-            except (KeyError, ValueError) as e:
-                print(f"Error parsing user data: {e}", file=sys.stderr)
+        logger.debug("ColorUserModel set_data called with %d users", len(json_list))
+        self._users = _parse_rows(json_list, _color_user_from_json, "user")
+        self._avatar_by_email = {user.email: user.avatar for user in self._users}
 
     def avatarForEmail(self, email: str) -> str:
         """Get avatar URL for a given email"""
-        for user in self._users:
-            if user.email == email:
-                return user.avatar
-        return ""
+        return self._avatar_by_email.get(email, "")
 
 
 class ColorModel:
@@ -84,21 +106,7 @@ class ColorModel:
     @reset
     def set_data(self, json_list: list[dict[str, Any]]) -> None:
         """Set colors from JSON data using @reset decorator for proper model updates"""
-        self._colors.clear()
-        for item in json_list:
-            try:
-                # Handle both 'id' (reqres.in) and 'color_id' (FastAPI server)
-                color_id = int(item.get("color_id") or item.get("id"))
-                color = Color(
-                    color_id=color_id,
-                    color=item["color"],
-                    name=item["name"],
-                    pantone_value=item["pantone_value"]
-                )
-                self._colors.append(color)
-                print(f"Added color: {color.name}")
-            except (KeyError, ValueError) as e:
-                print(f"Error parsing color data: {e}", file=sys.stderr)
+        self._colors = _parse_rows(json_list, _color_from_json, "color")
 
 
 class PaginatedResource(AbstractResource):
@@ -113,6 +121,9 @@ class PaginatedResource(AbstractResource):
         self._current_page: int = 1
         self._path: str = ""
         self._data_updated: bool = False
+        # One page of look-ahead, fetched while the user views the current one
+        self._prefetch: Optional[Future] = None
+        self._prefetch_page: int = 0
 
     def _clear_model(self) -> None:
         """Override in subclasses to clear the specific model"""
@@ -137,6 +148,8 @@ class PaginatedResource(AbstractResource):
 
     @path.setter
     def path(self, p: str) -> None:
+        if self._path != p:
+            self._discard_prefetch()
         self._path = p
 
     @property
@@ -157,25 +170,59 @@ class PaginatedResource(AbstractResource):
     def refreshCurrentPage(self) -> bool:
         """Refresh the current page data from the server. Returns True on success."""
         if not self._service:
-            print("No service configured for pagination", file=sys.stderr)
+            logger.error("No service configured for pagination")
             return False
 
         try:
-            # Add page parameter to the request
-            params = {"page": str(self._current_page)}
-            response = self._service.get(self._path, params)
+            response = self._take_prefetched(self._current_page)
+            if response is None:
+                # Add page parameter to the request
+                params = {"page": str(self._current_page)}
+                response = self._service.get(self._path, params)
 
             if response:
                 self.refreshRequestFinished(response)
+                self._prefetch_next_page()
                 return True
             else:
                 self.refreshRequestFailed()
                 return False
         except Exception as e:
-            print(f"PaginatedResource error: {e}", file=sys.stderr)
+            logger.error("PaginatedResource error: %s", e)
             self.refreshRequestFailed()
             return False
 
+    def _prefetch_next_page(self) -> None:
+        """Start fetching the page after the current one in the background"""
+        self._discard_prefetch()
+        if self._current_page >= self._pages:
+            return
+        self._prefetch_page = self._current_page + 1
+        params = {"page": str(self._prefetch_page)}
+        self._prefetch = self._service._get_async(self._path, params)
+
+    def _take_prefetched(self, page: int) -> Optional[dict[str, Any]]:
+        """Return the prefetched response for page, or None to fetch it again"""
+        if self._prefetch is None or self._prefetch_page != page:
+            return None
+        prefetch = self._prefetch
+        self._prefetch = None
+        try:
+            # Bounded by the request timeout of the worker
+            response = prefetch.result()
+        except Exception as e:
+            logger.debug("Prefetch of page %d failed: %s", page, e)
+            return None
+        # A failed prefetch yields {}; let the caller issue a fresh GET
+        return response or None
+
+    def _discard_prefetch(self) -> None:
+        """Forget the look-ahead page. A fetch already running cannot be
+           stopped, but its result is never read once it is dropped here."""
+        if self._prefetch is not None:
+            self._prefetch.cancel()
+            self._prefetch = None
+
     def refreshRequestFinished(self, json_data: dict[str, Any]) -> None:
         """Handle successful refresh response"""
         try:
@@ -184,9 +231,9 @@ class PaginatedResource(AbstractResource):
             self._current_page = int(json_data.get("page", 1))
             # NOTE: Setting self.data from Python doesn't trigger signals for bridge_type
             # Signal emission must come from QML property write or explicit C++ call
-            print(f"Refreshed page {self._current_page} of {self._pages}")
+            logger.debug("Refreshed page %d of %d", self._current_page, self._pages)
         except (ValueError, KeyError) as e:
-            print(f"Error parsing pagination data: {e}", file=sys.stderr)
+            logger.error("Error parsing pagination data: %s", e)
             self.refreshRequestFailed()
 
     def refreshRequestFailed(self) -> None:
@@ -203,51 +250,59 @@ class PaginatedResource(AbstractResource):
     def update(self, data: dict[str, Any], item_id: int) -> None:
         """Update an existing item"""
         if not self._service:
-            print("No service configured for update", file=sys.stderr)
+            logger.error("No service configured for update")
             return
 
         try:
+            self._discard_prefetch()
             response = self._service.put(f"{self._path}/{item_id}", data)
             if response:
                 self.refreshCurrentPage()
         except Exception as e:
-            print(f"Update error: {e}", file=sys.stderr)
+            logger.error("Update error: %s", e)
 
     def add(self, data: dict[str, Any]) -> None:
         """Add a new item"""
         if not self._service:
-            print("No service configured for add", file=sys.stderr)
+            logger.error("No service configured for add")
             return
 
         try:
-            print(f"Adding item with data: {data}")  # Debug
+            self._discard_prefetch()
             response = self._service.post(self._path, data)
             if response:
                 self.refreshCurrentPage()
         except Exception as e:
-            print(f"Add error: {e}", file=sys.stderr)
+            logger.error("Add error: %s", e)
 
     def remove(self, item_id: int) -> None:
         """Remove an item by ID"""
         if not self._service:
-            print("No service configured for remove", file=sys.stderr)
+            logger.error("No service configured for remove")
             return
 
         try:
+            self._discard_prefetch()
             response = self._service.delete(f"{self._path}/{item_id}")
             if response is not None:  # DELETE might return empty response
                 self.refreshCurrentPage()
         except Exception as e:
-            print(f"Remove error: {e}", file=sys.stderr)
+            logger.error("Remove error: %s", e)
 
 
 class PaginatedColorUsersResource(PaginatedResource):
     """Paginated resource for color users"""
 
+    # The QML singleton is registered once per process and shared by every
+    # instance, so re-created resources (hot reload, extra windows) reuse it
+    _shared_model: Optional[ColorUserModel] = None
+
     def __init__(self) -> None:
         super().__init__()
-        self._model = ColorUserModel()
-        bridge_instance(self._model, name="ColorUserModel")
+        if PaginatedColorUsersResource._shared_model is None:
+            PaginatedColorUsersResource._shared_model = ColorUserModel()
+            bridge_instance(PaginatedColorUsersResource._shared_model, name="ColorUserModel")
+        self._model = PaginatedColorUsersResource._shared_model
 
     @property
     def model(self) -> ColorUserModel:
@@ -268,10 +323,16 @@ class PaginatedColorUsersResource(PaginatedResource):
 class PaginatedColorsResource(PaginatedResource):
     """Paginated resource for colors"""
 
+    # The QML singleton is registered once per process and shared by every
+    # instance, so re-created resources (hot reload, extra windows) reuse it
+    _shared_model: Optional[ColorModel] = None
+
     def __init__(self) -> None:
         super().__init__()
-        self._model = ColorModel()
-        bridge_instance(self._model, name="ColorModel")
+        if PaginatedColorsResource._shared_model is None:
+            PaginatedColorsResource._shared_model = ColorModel()
+            bridge_instance(PaginatedColorsResource._shared_model, name="ColorModel")
+        self._model = PaginatedColorsResource._shared_model
 
     @property
     def model(self) -> ColorModel:
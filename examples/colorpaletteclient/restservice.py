@@ -2,13 +2,25 @@
 # SPDX-License-Identifier: LicenseRef-Qt-Commercial OR BSD-3-Clause
 
 
-import sys
+import logging
+import weakref
+from concurrent.futures import Future, ThreadPoolExecutor
+import orjson
 import requests
 from typing import List, Any, Optional, Dict
 from abstractresource import AbstractResource
 from QtBridge import complete
 
 
+logger = logging.getLogger(__name__)
+
+_JSON_HEADERS = {"Content-Type": "application/json"}
+
+# Seconds to wait for the server, so neither the GUI thread nor the prefetch
+# worker can hang on a request that never completes
+_TIMEOUT = 10
+
+
 class RestService:
     """RestService using Python requests instead of Qt networking"""
 
@@ -20,6 +32,13 @@ class RestService:
         self._session.verify = True
         # Add reqres.in API key header
         self._session.headers.update({"x-api-key": "reqres-free-v1"})
+        # Single worker used to fetch data ahead of time without blocking QML.
+        # requests.Session is not thread-safe, so the worker has its own.
+        self._executor: ThreadPoolExecutor = ThreadPoolExecutor(
+            max_workers=1, thread_name_prefix="RestService")
+        self._prefetch_session: requests.Session = requests.Session()
+        self._finalizer = weakref.finalize(
+            self, RestService._shutdown, self._executor, self._prefetch_session, self._session)
         self._component_complete_called: bool = False
         self._initialization_pending: bool = True
 
@@ -29,8 +48,8 @@ class RestService:
 
     @url.setter
     def url(self, url: str) -> None:
-        if self._base_url != url:
-            self._base_url = url
+        # Stored without the trailing slash so requests can join paths directly
+        self._base_url = url.rstrip('/')
 
     @property
     def sslSupported(self) -> bool:
@@ -64,56 +83,70 @@ class RestService:
         if not self._component_complete_called:
             self.componentComplete()
 
+    def _join(self, path: str) -> str:
+        """Build the full URL for path against the stripped base URL"""
+        return f"{self._base_url}/{path.lstrip('/')}"
+
     def _ensure_initialized(self) -> None:
         """Ensure all resources are initialized before making requests"""
         if self._initialization_pending or not self._component_complete_called:
             self.componentComplete()
 
-    def get(self, path: str, params: Optional[dict[str, Any]] = None) -> dict[str, Any]:
-        """Perform GET request"""
-        self._ensure_initialized()
+    @staticmethod
+    def _shutdown(executor: ThreadPoolExecutor, *sessions: requests.Session) -> None:
+        executor.shutdown(wait=False, cancel_futures=True)
+        for session in sessions:
+            session.close()
+
+    def close(self) -> None:
+        """Stop the prefetch worker and close the HTTP sessions"""
+        self._finalizer()
+
+    def _request(self, method: str, path: str, json_body: Any = None,
+                 session: Optional[requests.Session] = None,
+                 **kwargs: Any) -> dict[str, Any]:
+        """Send a request and decode the JSON reply, returning {} on failure"""
         try:
-            url = f"{self._base_url.rstrip('/')}/{path.lstrip('/')}"
-            response = self._session.get(url, params=params)
+            if json_body is not None:
+                kwargs["data"] = orjson.dumps(json_body)
+                kwargs["headers"] = _JSON_HEADERS
+            kwargs.setdefault("timeout", _TIMEOUT)
+            session = session or self._session
+            response = session.request(method, self._join(path), **kwargs)
             response.raise_for_status()
-            return response.json()
+            content = response.content
+            return orjson.loads(content) if content else {}
         except Exception as e:
-            print(f"GET request failed: {e}", file=sys.stderr)
+            logger.error("%s request failed: %s", method, e)
             return {}
 
+    def get(self, path: str, params: Optional[dict[str, Any]] = None) -> dict[str, Any]:
+        """Perform GET request"""
+        self._ensure_initialized()
+        return self._request("GET", path, params=params)
+
+    def _get_async(self, path: str, params: Optional[dict[str, Any]] = None) -> Future:
+        """Schedule a GET request on the background worker"""
+        self._ensure_initialized()
+        # The worker sends a copy of the current headers, so setAuthToken()
+        # never mutates anything the worker thread is reading
+        headers = dict(self._session.headers)
+        return self._executor.submit(self._request, "GET", path,
+                                     session=self._prefetch_session,
+                                     params=params, headers=headers)
+
     def post(self, path: str, data: dict[str, Any]) -> Optional[dict[str, Any]]:
         """Send POST request"""
         self._ensure_initialized()
-        try:
-            url = f"{self._base_url.rstrip('/')}/{path.lstrip('/')}"
-            response = self._session.post(url, json=data)
-            response.raise_for_status()
-            return response.json() if response.content else {}
-        except Exception as e:
-            print(f"POST request failed: {e}", file=sys.stderr)
-            return {}
+        return self._request("POST", path, json_body=data)
 
     def put(self, path: str, data: dict[str, Any]) -> dict[str, Any]:
         """Perform PUT request"""
-        try:
-            url = f"{self._base_url.rstrip('/')}/{path.lstrip('/')}"
-            response = self._session.put(url, json=data)
-            response.raise_for_status()
-            return response.json() if response.content else {}
-        except Exception as e:
-            print(f"PUT request failed: {e}", file=sys.stderr)
-            return {}
+        return self._request("PUT", path, json_body=data)
 
     def delete(self, path: str) -> dict[str, Any]:
         """Perform DELETE request"""
-        try:
-            url = f"{self._base_url.rstrip('/')}/{path.lstrip('/')}"
-            response = self._session.delete(url)
-            response.raise_for_status()
-            return response.json() if response.content else {}
-        except Exception as e:
-            print(f"DELETE request failed: {e}", file=sys.stderr)
-            return {}
+        return self._request("DELETE", path)
 
     def setAuthToken(self, token: str) -> None:
         """Set authentication token for requests"""
@@ -1,10 +1,11 @@
 # Copyright (C) 2024 The Qt Company Ltd.
 # SPDX-License-Identifier: LicenseRef-Qt-Commercial OR BSD-3-Clause
 
-import json
+import orjson
 from pathlib import Path
 from fastapi import FastAPI, HTTPException, Request, Depends, status
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import ORJSONResponse
 from fastapi.staticfiles import StaticFiles
 from pydantic import BaseModel
 from typing import Optional
@@ -15,35 +16,36 @@ COLORS_PATH = DATA_DIR / "colors.json"
 SESSIONS_PATH = DATA_DIR / "sessions.json"
 USERS_PATH = DATA_DIR / "users.json"
 
-with open(COLORS_PATH) as f:
-    colors = json.load(f)
-with open(SESSIONS_PATH) as f:
-    sessions = json.load(f)
-with open(USERS_PATH) as f:
-    users = json.load(f)
+colors = orjson.loads(COLORS_PATH.read_bytes())
+sessions = orjson.loads(SESSIONS_PATH.read_bytes())
+users = orjson.loads(USERS_PATH.read_bytes())
+
+# Add color_id field if missing
+for idx, c in enumerate(colors):
+    c.setdefault("color_id", idx + 1)
+
+# Lookup indexes, kept in sync with the lists above on every mutation
+users_by_email = {u["email"]: u for u in users}
+sessions_by_cred = {(s["email"], s["password"]): s for s in sessions}
+colors_by_id = {c["color_id"]: c for c in colors}
+max_color_id = max(colors_by_id, default=0)
 
 # In-memory token store (token: email)
 tokens = {}
 
 def get_user_by_email(email):
-    for u in users:
-        if u["email"] == email:
-            return u
-    return None
+    return users_by_email.get(email)
 
 def get_color_by_id(cid):
-    for c in colors:
-        if c.get("color_id") == cid or c.get("name") == cid:
-            return c
-    return None
+    return colors_by_id.get(cid)
 
 def require_auth(request: Request):
-    token = request.headers.get("token")
-    if not token or token not in tokens:
+    email = tokens.get(request.headers.get("token"))
+    if email is None:
         raise HTTPException(status_code=401, detail="Unauthorized")
-    return tokens[token]
+    return email
 
-app = FastAPI()
+app = FastAPI(default_response_class=ORJSONResponse)
 
 # Serve /img/faces/* from assets/img/
 app.mount("/img/faces", StaticFiles(directory=DATA_DIR / "img"), name="faces")
@@ -68,21 +70,16 @@ class Color(BaseModel):
 
 @app.post("/api/login")
 def login(data: LoginRequest):
-    for s in sessions:
-        if s["email"] == data.email and s["password"] == data.password:
-            # Issue a fake token
-            token = f"token-{data.email}"
-            tokens[token] = data.email
-            user = get_user_by_email(data.email)
-            return {"token": token, "id": user.get("id", 1) if user else 1}
-    raise HTTPException(status_code=401, detail="Invalid credentials")
+    if (data.email, data.password) not in sessions_by_cred:
+        raise HTTPException(status_code=401, detail="Invalid credentials")
+    # Issue a fake token
+    token = f"token-{data.email}"
+    tokens[token] = data.email
+    user = get_user_by_email(data.email)
+    return {"token": token, "id": user.get("id", 1) if user else 1}
 
 @app.get("/api/colors")
 def list_colors():
-    # Add color_id field if missing
-    for idx, c in enumerate(colors):
-        if "color_id" not in c:
-            c["color_id"] = idx + 1
     return {"data": colors, "total_pages": 1, "page": 1}
 
 @app.get("/api/colors/{cid}")
@@ -94,16 +91,31 @@ def get_color(cid: int):
 
 @app.post("/api/colors")
 def add_color(color: Color, user=Depends(require_auth)):
-    color.color_id = max((c.get("color_id", 0) for c in colors), default=0) + 1 if color.color_id is None else color.color_id
-    colors.append(color.dict())
+    global max_color_id
+    if color.color_id is None:
+        color.color_id = max_color_id + 1
+    elif color.color_id in colors_by_id:
+        raise HTTPException(status_code=409, detail="Color id already exists")
+    max_color_id = max(max_color_id, color.color_id)
+    c = color.dict()
+    colors.append(c)
+    colors_by_id[color.color_id] = c
     return color
 
 @app.put("/api/colors/{cid}")
 def update_color(cid: int, color: Color, user=Depends(require_auth)):
+    global max_color_id
     c = get_color_by_id(cid)
     if not c:
         raise HTTPException(status_code=404, detail="Not found")
+    new_id = color.color_id
+    if new_id is not None and new_id != cid and new_id in colors_by_id:
+        raise HTTPException(status_code=409, detail="Color id already exists")
     c.update(color.dict(exclude_unset=True))
+    if c["color_id"] != cid:
+        del colors_by_id[cid]
+        colors_by_id[c["color_id"]] = c
+        max_color_id = max(max_color_id, c["color_id"])
     return c
 
 @app.delete("/api/colors/{cid}")
@@ -112,6 +124,7 @@ def delete_color(cid: int, user=Depends(require_auth)):
     if not c:
         raise HTTPException(status_code=404, detail="Not found")
     colors.remove(c)
+    del colors_by_id[cid]
     return {"ok": True}
 
 @app.get("/api/users")
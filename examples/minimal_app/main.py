@@ -1,25 +1,32 @@
 # Copyright (C) 2025 The Qt Company Ltd.
 # SPDX-License-Identifier: LicenseRef-Qt-Commercial OR BSD-3-Clause
 
+from collections import Counter
+
 from QtBridge import bridge_instance, insert, remove, edit, qtbridge
 
 
 class StringModel:
     def __init__(self):
         self._items = ["Apple", "Banana", "Cherry"]
+        # Shadow multiset of _items for O(1) duplicate checks; counted
+        # because set_item() may still introduce duplicates
+        self._seen = Counter(self._items)
 
     @insert
     def add_string(self, value: str):
-        if value in self._items:
+        if value in self._seen:
             print(f"Duplicate found: {value}")
             return False
         self._items.append(value)
+        self._seen[value] += 1
         return True
 
     @remove
     def delete_string(self, index: int):
         if 0 <= index < len(self._items):
             value = self._items.pop(index)
+            self._forget(value)
             print(f"Deleted item: {value}")
             return True
         return False
@@ -27,11 +34,18 @@ class StringModel:
     @edit
     def set_item(self, index: int, value: str):
         if 0 <= index < len(self._items):
+            self._forget(self._items[index])
             self._items[index] = value
+            self._seen[value] += 1
             print(f"Item at index {index} set to {value}")
             return True
         return False
 
+    def _forget(self, value: str):
+        self._seen[value] -= 1
+        if not self._seen[value]:
+            del self._seen[value]
+
     def data(self) -> list[str]:
         return self._items
 
@@ -1,16 +1,84 @@
 # Copyright (C) 2025 The Qt Company Ltd.
 # SPDX-License-Identifier: LicenseRef-Qt-Commercial OR LGPL-3.0-only
 
+import importlib
+import importlib.util
 import os
 import sys
+import time
+from contextlib import contextmanager
 from pathlib import Path
 from typing import Any
 
 
-def _setup_dependencies():
-    """Ensure Shiboken and PySide6 dependencies are properly loaded."""
+# Lazily resolved attributes: name -> (submodule, attribute)
+_LAZY = {
+    "cpython_bridge_instance": (".QtBridge", "bridge_instance"),
+    "bridge_type": (".QtBridge", "bridge_type"),
+    "insert": (".QtBridge", "insert"),
+    "remove": (".QtBridge", "remove"),
+    "move": (".QtBridge", "move"),
+    "edit": (".QtBridge", "edit"),
+    "reset": (".QtBridge", "reset"),
+    "complete": (".QtBridge", "complete"),
+    "qtbridge": (".qtbridge_py.qtbridge", "qtbridge"),
+    "bridge_instance": (".qtbridge_py.autoqmlbridge", "bridge_instance"),
+}
+
+_deps_ready = False
+# Handles returned by os.add_dll_directory(), kept alive for the process
+_dll_dir_handles = []
+_dll_dirs_done = False
+
+# QTBRIDGE_PROFILE_STARTUP=1 records how long each dependency setup phase
+# takes and writes the result to ~/.qtbridge/startup-<pid>.json
+_PROFILE_STARTUP = os.environ.get("QTBRIDGE_PROFILE_STARTUP") == "1"
+_phases = []
+
+
+@contextmanager
+def _phase(name):
+    """Record the duration of the enclosed block when profiling startup."""
+    if not _PROFILE_STARTUP:
+        yield
+        return
+    start = time.perf_counter_ns()
+    try:
+        yield
+    finally:
+        _phases.append((name, time.perf_counter_ns() - start))
+
+
+def _write_startup_profile():
+    import json
+
+    profile_dir = Path.home() / ".qtbridge"
+    profile_dir.mkdir(exist_ok=True)
+    report = {"phases": _phases, "totalNs": sum(d for _, d in _phases)}
+    with open(profile_dir / f"startup-{os.getpid()}.json", "w") as f:
+        json.dump(report, f)
+
+
+def _register_dll_dirs():
+    """Add the PySide6 and shiboken6 directories to the Windows DLL search path."""
+    global _dll_dirs_done
+    if _dll_dirs_done:
+        return
+    # find_spec() locates the packages without importing them, so the
+    # directories are registered before the first binding is loaded
+    with _phase("dll_dirs"):
+        for package in ("PySide6", "shiboken6"):
+            spec = importlib.util.find_spec(package)
+            if spec is not None and spec.origin:
+                _dll_dir_handles.append(os.add_dll_directory(str(Path(spec.origin).parent)))
+    _dll_dirs_done = True
+
+
+def _import_qt():
+    """Import Shiboken and PySide6, reporting the search path on failure."""
     try:
-        from shiboken6 import Shiboken  # noqa: F401
+        with _phase("shiboken"):
+            from shiboken6 import Shiboken  # noqa: F401
     except ImportError:
         paths = ', '.join(sys.path)
         print(
@@ -20,7 +88,8 @@ def _setup_dependencies():
         raise
 
     try:
-        import PySide6  # noqa: F401
+        with _phase("pyside"):
+            import PySide6  # noqa: F401
     except ImportError:
         paths = ', '.join(sys.path)
         print(
@@ -29,62 +98,45 @@ def _setup_dependencies():
         )
         raise
 
+
+def _setup_dependencies():
+    """Ensure Shiboken and PySide6 dependencies are properly loaded."""
+    global _deps_ready
+    if _deps_ready:
+        return
+
     if sys.platform == 'win32':
-        for dll_dir in [Path(PySide6.__file__).parent, Path(Shiboken.__file__).parent]:
-            os.add_dll_directory(str(dll_dir))
+        _register_dll_dirs()
+    _import_qt()
+    _deps_ready = True
+    if _PROFILE_STARTUP:
+        _write_startup_profile()
+
+
+if sys.platform == 'win32':
+    _register_dll_dirs()
 
 # Lazy loading of attributes
 def __getattr__(name: str) -> Any:
-    if name == "cpython_bridge_instance":
-        _setup_dependencies()
-        from .QtBridge import bridge_instance
-        globals()["cpython_bridge_instance"] = bridge_instance
-        return bridge_instance
-    if name == "bridge_type":
-        _setup_dependencies()
-        from .QtBridge import bridge_type
-        globals()["bridge_type"] = bridge_type
-        return bridge_type
-    if name == "insert":
-        _setup_dependencies()
-        from .QtBridge import insert
-        globals()["insert"] = insert
-        return insert
-    if name == "remove":
-        _setup_dependencies()
-        from .QtBridge import remove
-        globals()["remove"] = remove
-        return remove
-    if name == "move":
+    entry = _LAZY.get(name)
+    if entry is None:
+        raise AttributeError(f"module '{__name__}' has no attribute '{name}'")
+    if not _deps_ready:
         _setup_dependencies()
-        from .QtBridge import move
-        globals()["move"] = move
-        return move
-    if name == "edit":
-        _setup_dependencies()
-        from .QtBridge import edit
-        globals()["edit"] = edit
-        return edit
-    if name == "reset":
-        _setup_dependencies()
-        from .QtBridge import reset
-        globals()["reset"] = reset
-        return reset
-    if name == "complete":
-        _setup_dependencies()
-        from .QtBridge import complete
-        globals()["complete"] = complete
-        return complete
-    if name == "qtbridge":
-        _setup_dependencies()
-        from .qtbridge_py.qtbridge import qtbridge
-        globals()["qtbridge"] = qtbridge
-        return qtbridge
-    if name == "bridge_instance":
-        _setup_dependencies()
-        from .qtbridge_py.autoqmlbridge import bridge_instance
-        globals()["bridge_instance"] = bridge_instance
-        return bridge_instance
-    raise AttributeError(f"module '{__name__}' has no attribute '{name}'")
+    module_name, attr = entry
+    value = getattr(importlib.import_module(module_name, __name__), attr)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | _LAZY.keys())
+
+__all__ = list(_LAZY)
 
-__all__ = ["bridge_instance", "insert", "remove", "move", "edit", "reset", "complete", "qtbridge", "cpython_bridge_instance"]
+# QTBRIDGE_EAGER=1 resolves every lazy attribute at import time, so later
+# accesses are plain module attribute lookups instead of __getattr__ calls
+if os.environ.get("QTBRIDGE_EAGER") == "1":
+    for _name in _LAZY:
+        __getattr__(_name)
+    del _name
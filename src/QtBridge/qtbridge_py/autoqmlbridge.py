@@ -1,29 +1,31 @@
 # Copyright (C) 2025 The Qt Company Ltd.
 # SPDX-License-Identifier: LicenseRef-Qt-Commercial OR LGPL-3.0-only
 
-from PySide6.QtCore import QRangeModel
-from PySide6.QtQml import qmlRegisterSingletonInstance
-
+# QRangeModels registered as QML singletons, keyed by (uri, name). Keeping
+# them here stops Python from freeing a model QML still refers to.
 _bridge_map = {}
+# QtBridge.cpython_bridge_instance, resolved on first use
+_cpython_bridge_instance = None
 
 
 def bridge_instance(obj, name, uri="backend"):
 
-    # Handle numpy arrays
-    if "numpy" in type(obj).__module__:
+    # Handle numpy arrays. QRangeModel needs a Python sequence, and
+    # tolist() converts the whole buffer in a single C-level pass.
+    if type(obj).__module__.startswith("numpy"):
         obj = obj.tolist()
 
     if isinstance(obj, (list, tuple)):
+        from PySide6.QtCore import QRangeModel
+        from PySide6.QtQml import qmlRegisterSingletonInstance
+
         model_instance = QRangeModel(obj)
         qmlRegisterSingletonInstance(
             type(model_instance), uri, 1, 0, name, model_instance)
-        _bridge_map["model"] = model_instance
-
-    elif hasattr(obj, "__class__"):
-        from QtBridge import cpython_bridge_instance
-        cpython_bridge_instance(obj, name=name, uri=uri)
+        _bridge_map[(uri, name)] = model_instance
 
     else:
-        raise TypeError(
-            f"Unsupported type for bridge_instance: {type(obj).__name__}"
-        )
+        global _cpython_bridge_instance
+        if _cpython_bridge_instance is None:
+            from QtBridge import cpython_bridge_instance as _cpython_bridge_instance
+        _cpython_bridge_instance(obj, name=name, uri=uri)
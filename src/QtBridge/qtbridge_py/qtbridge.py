@@ -2,12 +2,12 @@
 # SPDX-License-Identifier: LicenseRef-Qt-Commercial OR LGPL-3.0-only
 
 import sys
-import inspect
 from functools import wraps
 from pathlib import Path
-from PySide6.QtCore import QUrl
-from PySide6.QtGui import QGuiApplication
-from PySide6.QtQml import QQmlApplicationEngine
+
+# Application shared by every @qtbridge entry point in the process; Qt only
+# supports one, and keeping it here avoids re-creating it on later calls
+_app = None
 
 
 def qtbridge(
@@ -20,30 +20,46 @@ def qtbridge(
     Decorator that wraps a function into a QtBridges application context.
     """
     def decorator(func):
+        # Relative QML files are resolved against the file applying the
+        # decorator; this never changes between calls, so do it only once
+        qml_path = None
+        if qml_file:
+            qml_path = Path(qml_file)
+            if not qml_path.is_absolute():
+                caller_dir = Path(sys._getframe(1).f_code.co_filename).parent
+                qml_path = caller_dir / qml_path
+            qml_path = qml_path.resolve()
+        # Built on the first call, once QtCore has been imported
+        qml_url = None
+        extra_import_paths = tuple(import_paths or ())
+
         @wraps(func)
         def wrapper(*args, **kwargs):
+            nonlocal qml_url
+            # Imported on first call so that importing QtBridge does not load
+            # the QtGui/QtQml bindings until an application is started
+            from PySide6.QtCore import QUrl
+            from PySide6.QtGui import QGuiApplication
+            from PySide6.QtQml import QQmlApplicationEngine
+            from shiboken6 import Shiboken
 
-            app = QGuiApplication.instance()
-            if not app:
-                app = QGuiApplication(sys.argv)
+            global _app
+            if _app is None:
+                _app = QGuiApplication.instance() or QGuiApplication(sys.argv)
+            app = _app
             func(*args, **kwargs)
             engine = QQmlApplicationEngine()
 
-            if import_paths:
-                for path in import_paths:
-                    engine.addImportPath(path)
-            engine.addImportPath(sys.path[0])
+            add_import_path = engine.addImportPath
+            for path in extra_import_paths:
+                add_import_path(path)
+            add_import_path(sys.path[0])
 
             # --- Load QML content ---
-            if qml_file:
-                caller_frame = inspect.stack()[1]
-                caller_file = Path(caller_frame.filename).resolve().parent
-
-                qml_path = Path(qml_file)
-                if not qml_path.is_absolute():
-                    qml_path = caller_file / qml_path
-
-                engine.load(QUrl.fromLocalFile(str(qml_path)))
+            if qml_path is not None:
+                if qml_url is None:
+                    qml_url = QUrl.fromLocalFile(str(qml_path))
+                engine.load(qml_url)
 
             elif module and type_name:
                 engine.loadFromModule(module, type_name)
@@ -53,11 +69,12 @@ def qtbridge(
                 raise ValueError("Either 'qml_file' or 'module' must be specified.")
 
             if not engine.rootObjects():
-                del engine
-                sys.exit(-1)
+                # No event loop runs after the raise, so a deferred delete
+                # would never be processed; destroy the engine right away
+                Shiboken.delete(engine)
+                source = qml_path if qml_path is not None else module
+                raise RuntimeError(f"Failed to load QML from '{source}'")
 
-            result = app.exec()
-            del engine
-            return result
+            return app.exec()
         return wrapper
     return decorator
@@ -1,17 +1,73 @@
 # Copyright (C) 2025 The Qt Company Ltd.
 # SPDX-License-Identifier: LicenseRef-Qt-Commercial OR GPL-3.0-only
 
+import collections
+import os
 import sys
 from pathlib import Path
 
+import pytest
+
+# Qt log message captured by the test modules' message handlers
+LogRecord = collections.namedtuple("LogRecord", "type message")
+
 
 def pytest_configure():
     # Find the built extension
     root_dir = Path(__file__).parent.parent
-    # Update pattern to match actual path structure
-    build_dir = next(root_dir.glob("build/*/src/QtBridge"), None)
+    # Prefer a location exported by the caller or inherited from a parent
+    # process, as long as it still exists; otherwise walk the build tree
+    cached = os.environ.get("QTBRIDGE_BUILD_DIR")
+    if cached and Path(cached).is_dir():
+        build_dir = Path(cached)
+    else:
+        # Update pattern to match actual path structure
+        build_dir = next(root_dir.glob("build/*/src/QtBridge"), None)
+        if build_dir:
+            os.environ["QTBRIDGE_BUILD_DIR"] = str(build_dir)
     qtbridge_dir = root_dir / "src" / "QtBridge"
     if build_dir:
         # Add the QtBridges directory directly to sys.path
         sys.path.insert(0, str(build_dir))
         sys.path.insert(0, str(qtbridge_dir))
+
+
+@pytest.fixture(scope="session", autouse=True)
+def _headless():
+    """Keep Qt off real displays and GPUs unless the caller chose otherwise"""
+    os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+    os.environ.setdefault("QSG_RHI_BACKEND", "null")
+    os.environ.setdefault("QT_QUICK_CONTROLS_STYLE", "Basic")
+
+
+@pytest.fixture(scope="session")
+def qapp(_headless):
+    """The one QApplication for the whole test session"""
+    from PySide6.QtWidgets import QApplication
+
+    return QApplication.instance() or QApplication([])
+
+
+@pytest.fixture(scope="session")
+def shared_engine(qapp):
+    """QQmlApplicationEngine shared by all tests of the session"""
+    from PySide6.QtQml import QQmlApplicationEngine
+
+    engine = QQmlApplicationEngine()
+    yield engine
+    engine.deleteLater()
+
+
+@pytest.fixture
+def engine(shared_engine):
+    """The shared engine, cleared of the root objects a test loaded into it"""
+    from PySide6.QtCore import QCoreApplication, QEvent
+
+    yield shared_engine
+    for root in shared_engine.rootObjects():
+        root.deleteLater()
+    # Run the deferred deletes now, so the roots are gone from rootObjects()
+    # and their components can leave the cache before the next test
+    QCoreApplication.sendPostedEvents(None, QEvent.Type.DeferredDelete)
+    assert not shared_engine.rootObjects(), "Root objects survived engine teardown"
+    shared_engine.clearComponentCache()
@@ -1,16 +1,14 @@
 # Copyright (C) 2025 The Qt Company Ltd.
 # SPDX-License-Identifier: LicenseRef-Qt-Commercial OR GPL-3.0-only
 
-from pathlib import Path
 from PySide6.QtCore import QUrl, qInstallMessageHandler
-from PySide6.QtQml import QQmlApplicationEngine
 
 from QtBridge import bridge_instance, insert, remove, edit
 
 import pytest
 from dataclasses import dataclass
 
-TEST_QML_METHOD = """
+TEST_QML_METHOD = b"""
 import QtQuick 2.0
 import backend 1.0
 
@@ -24,7 +22,7 @@ Item {
 }
 """
 
-TEST_QML_PROPERTY = """
+TEST_QML_PROPERTY = b"""
 import QtQuick 2.0
 import backend 1.0
 
@@ -61,15 +59,11 @@ class TestBridgeInstance:
 
     def setup_method(self):
         """Setup that runs before each test method"""
-        self.engine = QQmlApplicationEngine()
         self.test_model = AutoQmlBridgeTest()
         self.captured_messages = []
 
     def teardown_method(self):
         """Cleanup after each test method"""
-        if self.engine:
-            del self.engine
-            self.engine = None
         qInstallMessageHandler(None)
         self.captured_messages.clear()
 
@@ -81,19 +75,15 @@ class TestBridgeInstance:
         """Get all captured console messages"""
         return [msg for msg in self.captured_messages if not msg.startswith("qml:")]
 
-    def test_method_registration(self, qtbot, tmp_path: Path, capsys: pytest.CaptureFixture[str]):
+    def test_method_registration(self, qtbot, engine, capsys: pytest.CaptureFixture[str]):
         """Test basic functionality"""
         bridge_instance(self.test_model, name="Test_model")
 
-        # Write QML to temporary file
-        qml_file = tmp_path / "test.qml"
-        qml_file.write_text(TEST_QML_METHOD)
-
         # Load QML
-        self.engine.load(QUrl.fromLocalFile(str(qml_file)))
+        engine.loadData(TEST_QML_METHOD, QUrl())
 
         # Wait for QML to load
-        qtbot.waitUntil(lambda: bool(self.engine.rootObjects()))
+        qtbot.waitUntil(lambda: bool(engine.rootObjects()))
 
         # Verify model was updated
         assert len(self.test_model._strings) == 1
@@ -118,14 +108,11 @@ class TestBridgeInstance:
             # Restore the original data() method
             AutoQmlBridgeTest.data = original_data_method
 
-    def test_property_registration(self, qtbot, tmp_path: Path, capsys: pytest.CaptureFixture[str]):
-        engine = QQmlApplicationEngine()
+    def test_property_registration(self, qtbot, engine, capsys: pytest.CaptureFixture[str]):
         test_model = AutoQmlBridgeTest()
         bridge_instance(test_model, name="TestModel")
 
-        qml_file = tmp_path / "test.qml"
-        qml_file.write_text(TEST_QML_PROPERTY)
-        engine.load(QUrl.fromLocalFile(str(qml_file)))
+        engine.loadData(TEST_QML_PROPERTY, QUrl())
         qtbot.waitUntil(lambda: bool(engine.rootObjects()))
 
         captured = capsys.readouterr()
@@ -179,7 +166,7 @@ class TestBridgeInstance:
         except Exception as e:
             assert False, f"bridge_instance raised error unexpectedly: {e}"
 
-    def test_bridge_instance_with_custom_name(self, qtbot):
+    def test_bridge_instance_with_custom_name(self, qtbot, engine):
         """Test bridge_instance with custom name parameter"""
         class NamedModel:
             def __init__(self):
@@ -191,7 +178,7 @@ class TestBridgeInstance:
         model = NamedModel()
         bridge_instance(model, name="CustomNamedModel")
 
-        qml_content = """
+        qml_content = b"""
 import QtQuick 2.15
 import backend 1.0
 
@@ -202,14 +189,14 @@ Item {
 }
 """
         qInstallMessageHandler(self.message_handler)
-        self.engine.loadData(qml_content.encode(), QUrl())
+        engine.loadData(qml_content, QUrl())
         qtbot.wait(100)
 
         messages = self.get_console_messages()
         assert any("Model registered: true" in msg for msg in messages), \
             f"Expected model to be registered. Got: {messages}"
 
-    def test_bridge_instance_default_backend_uri(self, qtbot):
+    def test_bridge_instance_default_backend_uri(self, qtbot, engine):
         """Test that default uri 'backend' works"""
         class StringListModel:
             def __init__(self):
@@ -224,7 +211,7 @@ Item {
         model = StringListModel()
         bridge_instance(model, name="StringModel")
 
-        qml_content = """
+        qml_content = b"""
 import QtQuick 2.15
 import backend 1.0
 
@@ -235,14 +222,14 @@ Item {
 }
 """
         qInstallMessageHandler(self.message_handler)
-        self.engine.loadData(qml_content.encode(), QUrl())
+        engine.loadData(qml_content, QUrl())
         qtbot.wait(100)
 
         messages = self.get_console_messages()
         assert any("Count: 3" in msg for msg in messages), \
             f"Expected 'Count: 3' message. Got: {messages}"
 
-    def test_bridge_instance_custom_uri(self, qtbot):
+    def test_bridge_instance_custom_uri(self, qtbot, engine):
         """Test that custom uri works correctly"""
         class CustomUriModel:
             def __init__(self):
@@ -257,7 +244,7 @@ Item {
         model = CustomUriModel()
         bridge_instance(model, name="CustomModel", uri="myapp.models")
 
-        qml_content = """
+        qml_content = b"""
 import QtQuick 2.15
 import myapp.models 1.0
 
@@ -268,7 +255,7 @@ Item {
 }
 """
         qInstallMessageHandler(self.message_handler)
-        self.engine.loadData(qml_content.encode(), QUrl())
+        engine.loadData(qml_content, QUrl())
         qtbot.wait(100)
 
         messages = self.get_console_messages()
@@ -333,7 +320,7 @@ Item {
         assert hasattr(model, 'remove_item')
         assert hasattr(model, 'edit_item')
 
-    def test_bridge_instance_with_properties(self, qtbot, tmp_path: Path):
+    def test_bridge_instance_with_properties(self, qtbot, engine):
         """Test bridge_instance with Python properties"""
         class PropertyModel:
             def __init__(self):
@@ -355,7 +342,7 @@ Item {
         model = PropertyModel()
         bridge_instance(model, name="PropModel")
 
-        qml_content = """
+        qml_content = b"""
 import QtQuick 2.15
 import backend 1.0
 
@@ -365,8 +352,6 @@ Item {
     }
 }
 """
-        qml_file = tmp_path / "test_prop.qml"
-        qml_file.write_text(qml_content)
 
         import sys
         from io import StringIO
@@ -374,7 +359,7 @@ Item {
         sys.stdout = captured_output = StringIO()
 
         try:
-            self.engine.load(QUrl.fromLocalFile(str(qml_file)))
+            engine.loadData(qml_content, QUrl())
             qtbot.wait(100)
 
             output = captured_output.getvalue()
@@ -382,7 +367,7 @@ Item {
         finally:
             sys.stdout = old_stdout
 
-    def test_bridge_instance_with_methods(self, qtbot, tmp_path: Path):
+    def test_bridge_instance_with_methods(self, qtbot, engine):
         """Test bridge_instance with callable methods"""
         class MethodModel:
             def __init__(self):
@@ -402,7 +387,7 @@ Item {
         model = MethodModel()
         bridge_instance(model, name="MethodModel")
 
-        qml_content = """
+        qml_content = b"""
 import QtQuick 2.15
 import backend 1.0
 
@@ -413,8 +398,6 @@ Item {
     }
 }
 """
-        qml_file = tmp_path / "test_method.qml"
-        qml_file.write_text(qml_content)
 
         import sys
         from io import StringIO
@@ -422,7 +405,7 @@ Item {
         sys.stdout = captured_output = StringIO()
 
         try:
-            self.engine.load(QUrl.fromLocalFile(str(qml_file)))
+            engine.loadData(qml_content, QUrl())
             qtbot.wait(100)
 
             output = captured_output.getvalue()
@@ -478,7 +461,7 @@ Item {
         except Exception as e:
             assert False, f"bridge_instance failed with mixed type list: {e}"
 
-    def test_bridge_instance_same_name_different_uri(self, qtbot):
+    def test_bridge_instance_same_name_different_uri(self, qtbot, engine):
         """Test that same name can be used with different URIs"""
         class ModelV1:
             def data(self) -> list[str]:
@@ -499,7 +482,7 @@ Item {
         bridge_instance(model1, name="VersionModel", uri="app.v1")
         bridge_instance(model2, name="VersionModel", uri="app.v2")
 
-        qml_content = """
+        qml_content = b"""
 import QtQuick 2.15
 import app.v1 1.0 as V1
 import app.v2 1.0 as V2
@@ -512,7 +495,7 @@ Item {
 }
 """
         qInstallMessageHandler(self.message_handler)
-        self.engine.loadData(qml_content.encode(), QUrl())
+        engine.loadData(qml_content, QUrl())
         qtbot.wait(100)
 
         messages = self.get_console_messages()
@@ -1,48 +1,109 @@
 # Copyright (C) 2025 The Qt Company Ltd.
 # SPDX-License-Identifier: LicenseRef-Qt-Commercial OR GPL-3.0-only
 
+import collections
+import re
+
 import pytest
-import os
-import tempfile
-from PySide6.QtCore import QUrl, qInstallMessageHandler, QtMsgType
-from PySide6.QtQml import QQmlApplicationEngine
+from PySide6.QtCore import QLoggingCategory, QUrl, qInstallMessageHandler, QtMsgType
 
 from QtBridge import bridge_instance
 
+from conftest import LogRecord
+
+# Only QtBridges warnings and criticals are asserted on, so keep the rest of
+# Qt's logging from reaching the Python message handler at all
+_FILTER_RULES = "*.debug=false\n*.info=false\nqtbridges.warning=true\nqtbridges.critical=true"
+
+_USER_ERR_RE = re.compile(r"\b(ValueError|TypeError|AttributeError|KeyError|IndexError)\b")
+
+
+class UserErrorsModel:
+    def __init__(self):
+        self._items = ["item1", "item2"]
+
+    def cause_value_error(self) -> str:
+        raise ValueError("Invalid value provided by user")
+
+    def cause_type_error(self) -> str:
+        raise TypeError("Wrong type provided by user")
+
+    def cause_attribute_error(self) -> str:
+        raise AttributeError("Attribute not found")
+
+    def cause_key_error(self) -> str:
+        raise KeyError("Key not found in user data")
+
+    def cause_index_error(self) -> str:
+        raise IndexError("Index out of range")
+
+    def data(self):
+        return self._items
+
+
+class SystemErrorsModel:
+    def __init__(self):
+        self._items = ["item1"]
+
+    def cause_runtime_error(self) -> str:
+        raise RuntimeError("Database connection failed")
+
+    def cause_memory_error(self) -> str:
+        raise MemoryError("Out of memory")
+
+    def cause_os_error(self) -> str:
+        raise OSError("File system error")
+
+    def cause_import_error(self) -> str:
+        raise ImportError("Module not found")
+
+    def data(self):
+        return self._items
+
+
+@pytest.fixture(scope="module")
+def user_errors_model():
+    """UserErrorsModel singleton, registered once for all user error cases"""
+    model = UserErrorsModel()
+    bridge_instance(model, name="UserErrorsModel")
+    yield model
+
+
+@pytest.fixture(scope="module")
+def system_errors_model():
+    """SystemErrorsModel singleton, registered once for all system error cases"""
+    model = SystemErrorsModel()
+    bridge_instance(model, name="SystemErrorsModel")
+    yield model
+
+
 class TestErrorHandling:
     """Test error handling and logging behavior for both user errors and system errors"""
+
     def setup_method(self):
         """Setup that runs before each test method"""
-        self.engine = QQmlApplicationEngine()
-        self.captured_messages = []
+        # Captured QtBridges records, bucketed by message type
+        self._by_type = collections.defaultdict(list)
         self.original_handler = None
 
     def teardown_method(self):
         """Cleanup after each test"""
+        QLoggingCategory.setFilterRules("")
         if self.original_handler:
             qInstallMessageHandler(self.original_handler)
 
     def message_handler(self, msg_type, context, message):
-        """Custom Qt message handler to capture log messages"""
-        self.captured_messages.append({
-            'type': msg_type,
-            'category': context.category if hasattr(context, 'category') else '',
-            'message': message
-        })
+        """Custom Qt message handler to capture QtBridges log messages"""
+        if context.category != "qtbridges":
+            return
+        self._by_type[msg_type].append(LogRecord(msg_type, message))
 
     def setup_message_capture(self):
         """Setup message capture for Qt logging"""
-        self.captured_messages.clear()
+        self._by_type.clear()
+        QLoggingCategory.setFilterRules(_FILTER_RULES)
         qInstallMessageHandler(self.message_handler)
 
-    def get_qtbridge_messages(self, msg_type=None):
-        """Get messages from QtBridges category, optionally filtered by type"""
-        messages = [msg for msg in self.captured_messages
-                   if 'qtbridges' in msg.get('category', '')]
-        if msg_type is not None:
-            messages = [msg for msg in messages if msg['type'] == msg_type]
-        return messages
-
     def test_no_data_method(self, qtbot):
         """Test that error is raised when data() method is missing"""
 
@@ -68,7 +129,7 @@ class TestErrorHandling:
         finally:
             AutoQmlBridgeTest.data = original_data_method
 
-    def test_system_error_critical_logging(self, qtbot):
+    def test_system_error_critical_logging(self, qtbot, engine):
         """Test that system errors generate critical log messages"""
         self.setup_message_capture()
 
@@ -97,210 +158,114 @@ class TestErrorHandling:
         }
         """
 
-        with tempfile.NamedTemporaryFile(mode='w', suffix='.qml', delete=False) as f:
-            f.write(qml_content)
-            qml_path = f.name
-
-        try:
-            with pytest.raises(RuntimeError, match="Simulated Runtime failure"):
-                self.engine.load(QUrl.fromLocalFile(qml_path))
-                qtbot.waitUntil(lambda: bool(self.engine.rootObjects()), timeout=2000)
-            qtbot.wait(100)
-
-            warning_messages = self.get_qtbridge_messages(QtMsgType.QtWarningMsg)
-            critical_messages = self.get_qtbridge_messages(QtMsgType.QtCriticalMsg)
-
-            # Should have critical messages for RuntimeError
-            system_error_criticals = [msg for msg in critical_messages
-                                    if 'RuntimeError' in msg['message'] or 'Simulated Runtime failure' in msg['message']]
-            assert len(system_error_criticals) > 0, f"Expected critical messages for system error, got: {critical_messages}"
-
-            # RuntimeError should NOT be treated as user error (logged as warning)
-            runtime_warnings = [msg for msg in warning_messages
-                              if 'RuntimeError' in msg['message']]
-            assert len(runtime_warnings) == 0, f"System errors should not generate warning messages, got: {runtime_warnings}"
-
-        finally:
-            os.unlink(qml_path)
-
-    def test_user_error_types_are_warnings(self, qtbot):
+        with pytest.raises(RuntimeError, match="Simulated Runtime failure"):
+            with qtbot.waitSignal(engine.objectCreated, timeout=2000):
+                engine.loadData(qml_content.encode('utf-8'), QUrl())
+        qtbot.wait(100)
+
+        warning_messages = self._by_type[QtMsgType.QtWarningMsg]
+        critical_messages = self._by_type[QtMsgType.QtCriticalMsg]
+
+        # Should have critical messages for RuntimeError
+        system_error_criticals = [msg for msg in critical_messages
+                                if 'RuntimeError' in msg.message or 'Simulated Runtime failure' in msg.message]
+        assert len(system_error_criticals) > 0, f"Expected critical messages for system error, got: {critical_messages}"
+
+        # RuntimeError should NOT be treated as user error (logged as warning)
+        runtime_warnings = [msg for msg in warning_messages
+                          if 'RuntimeError' in msg.message]
+        assert len(runtime_warnings) == 0, f"System errors should not generate warning messages, got: {runtime_warnings}"
+
+    @pytest.mark.parametrize("method_name,exc_type,exc_msg", [
+        ("cause_value_error", ValueError, re.compile(r"Invalid value provided by user")),
+        ("cause_type_error", TypeError, re.compile(r"Wrong type provided by user")),
+        ("cause_attribute_error", AttributeError, re.compile(r"Attribute not found")),
+        ("cause_key_error", KeyError, re.compile(r"Key not found in user data")),
+        ("cause_index_error", IndexError, re.compile(r"Index out of range")),
+    ])
+    @pytest.mark.usefixtures("user_errors_model")
+    def test_user_error_types_are_warnings(self, qtbot, engine, method_name, exc_type, exc_msg):
         """Test that all user error types (ValueError, TypeError, etc.) generate warnings"""
         self.setup_message_capture()
 
-        class UserErrorsModel:
-            def __init__(self):
-                self._items = ["item1", "item2"]
-
-            def cause_value_error(self) -> str:
-                raise ValueError("Invalid value provided by user")
-
-            def cause_type_error(self) -> str:
-                raise TypeError("Wrong type provided by user")
-
-            def cause_attribute_error(self) -> str:
-                raise AttributeError("Attribute not found")
-
-            def cause_key_error(self) -> str:
-                raise KeyError("Key not found in user data")
-
-            def cause_index_error(self) -> str:
-                raise IndexError("Index out of range")
-
-            def data(self):
-                return self._items
+        qml_content = f"""
+        import QtQuick 2.0
+        import backend 1.0
 
-        model = UserErrorsModel()
-        bridge_instance(model, name="UserErrorsModel")
-
-        # Test each user error type
-        error_methods = [
-            "cause_value_error",
-            "cause_type_error",
-            "cause_attribute_error",
-            "cause_key_error",
-            "cause_index_error"
-        ]
-
-        for method_name in error_methods:
-            self.captured_messages.clear()  # Clear for each test
-
-            qml_content = f"""
-            import QtQuick 2.0
-            import backend 1.0
-
-            Item {{
-                Component.onCompleted: {{
-                    UserErrorsModel.{method_name}()
-                }}
+        Item {{
+            Component.onCompleted: {{
+                UserErrorsModel.{method_name}()
             }}
-            """
-
-            with tempfile.NamedTemporaryFile(mode='w', suffix='.qml', delete=False) as f:
-                f.write(qml_content)
-                qml_path = f.name
-
-            try:
-                error_map = {
-                    "cause_value_error": (ValueError, "Invalid value provided by user"),
-                    "cause_type_error": (TypeError, "Wrong type provided by user"),
-                    "cause_attribute_error": (AttributeError, "Attribute not found"),
-                    "cause_key_error": (KeyError, "Key not found in user data"),
-                    "cause_index_error": (IndexError, "Index out of range"),
-                }
-                exc_type, exc_msg = error_map[method_name]
-                with pytest.raises(exc_type, match=exc_msg):
-                    self.engine.load(QUrl.fromLocalFile(qml_path))
-                    qtbot.waitUntil(lambda: bool(self.engine.rootObjects()), timeout=2000)
-
-                # Check that this specific error type generates warnings
-                warning_messages = self.get_qtbridge_messages(QtMsgType.QtWarningMsg)
-                critical_messages = self.get_qtbridge_messages(QtMsgType.QtCriticalMsg)
-
-                print(f"Captured warning messages for {method_name}: {warning_messages}")
-                print(f"Captured critical messages for {method_name}: {critical_messages}")
-
-                # Should have warnings for user errors
-                method_warnings = [msg for msg in warning_messages
-                                 if (msg.get('category') == 'qtbridges' and
-                                     (method_name in msg['message'] or
-                                      any(error_type in msg['message'] for error_type in
-                                          ['ValueError', 'TypeError', 'AttributeError', 'KeyError', 'IndexError']) or
-                                      'Invalid value provided by user' in msg['message'] or
-                                      'Python method:' in msg['message']))]
-                assert len(method_warnings) > 0, f"Expected warning for {method_name}, got warnings: {warning_messages}"
-
-                # Should NOT have critical messages for user errors
-                method_criticals = [msg for msg in critical_messages
-                                  if method_name in msg['message']]
-                assert len(method_criticals) == 0, f"User error {method_name} should not generate critical messages, got: {method_criticals}"
-
-            finally:
-                os.unlink(qml_path)
-
-    def test_system_error_types_are_critical(self, qtbot):
+        }}
+        """
+
+        with pytest.raises(exc_type, match=exc_msg):
+            with qtbot.waitSignal(engine.objectCreated, timeout=2000):
+                engine.loadData(qml_content.encode('utf-8'), QUrl())
+
+        # Check that this specific error type generates warnings
+        warning_messages = self._by_type[QtMsgType.QtWarningMsg]
+        critical_messages = self._by_type[QtMsgType.QtCriticalMsg]
+
+        print(f"Captured warning messages for {method_name}: {warning_messages}")
+        print(f"Captured critical messages for {method_name}: {critical_messages}")
+
+        # Should have warnings for user errors
+        method_warnings = [msg for msg in warning_messages
+                         if (method_name in msg.message or
+                             _USER_ERR_RE.search(msg.message) or
+                             'Invalid value provided by user' in msg.message or
+                             'Python method:' in msg.message)]
+        assert len(method_warnings) > 0, f"Expected warning for {method_name}, got warnings: {warning_messages}"
+
+        # Should NOT have critical messages for user errors
+        method_criticals = [msg for msg in critical_messages
+                          if method_name in msg.message]
+        assert len(method_criticals) == 0, f"User error {method_name} should not generate critical messages, got: {method_criticals}"
+
+    @pytest.mark.parametrize("method_name,exc_type,exc_msg", [
+        ("cause_runtime_error", RuntimeError, re.compile(r"Database connection failed")),
+        ("cause_memory_error", MemoryError, re.compile(r"Out of memory")),
+        ("cause_os_error", OSError, re.compile(r"File system error")),
+        ("cause_import_error", ImportError, re.compile(r"Module not found")),
+    ])
+    @pytest.mark.usefixtures("system_errors_model")
+    def test_system_error_types_are_critical(self, qtbot, engine, method_name, exc_type, exc_msg):
         """Test that system error types (not in shouldSuppressError) generate critical messages"""
         self.setup_message_capture()
 
-        class SystemErrorsModel:
-            def __init__(self):
-                self._items = ["item1"]
-
-            def cause_runtime_error(self) -> str:
-                raise RuntimeError("Database connection failed")
-
-            def cause_memory_error(self) -> str:
-                raise MemoryError("Out of memory")
-
-            def cause_os_error(self) -> str:
-                raise OSError("File system error")
-
-            def cause_import_error(self) -> str:
-                raise ImportError("Module not found")
+        qml_content = f"""
+        import QtQuick 2.0
+        import backend 1.0
 
-            def data(self):
-                return self._items
+        Item {{
+            Component.onCompleted: {{
+                SystemErrorsModel.{method_name}()
+            }}
+        }}
+        """
 
-        model = SystemErrorsModel()
-        bridge_instance(model, name="SystemErrorsModel")
+        with pytest.raises(exc_type, match=exc_msg):
+            with qtbot.waitSignal(engine.objectCreated, timeout=2000):
+                engine.loadData(qml_content.encode('utf-8'), QUrl())
 
-        # Test each system error type
-        error_methods = [
-            "cause_runtime_error",
-            "cause_memory_error",
-            "cause_os_error",
-            "cause_import_error"
-        ]
+        # Check that this specific error type generates critical messages
+        warning_messages = self._by_type[QtMsgType.QtWarningMsg]
+        critical_messages = self._by_type[QtMsgType.QtCriticalMsg]
 
-        for method_name in error_methods:
-            self.captured_messages.clear()
+        # Should have critical messages for system errors
+        method_criticals = [msg for msg in critical_messages
+                          if method_name in msg.message or
+                             any(error_type in msg.message for error_type in
+                                 ['RuntimeError', 'MemoryError', 'OSError', 'ImportError'])]
+        assert len(method_criticals) > 0, f"Expected critical message for {method_name}, got criticals: {critical_messages}"
 
-            qml_content = f"""
-            import QtQuick 2.0
-            import backend 1.0
+        # Should NOT have warnings for system errors (they should be critical)
+        method_warnings = [msg for msg in warning_messages
+                         if method_name in msg.message]
+        assert len(method_warnings) == 0, f"System error {method_name} should not generate warnings, got: {method_warnings}"
 
-            Item {{
-                Component.onCompleted: {{
-                    SystemErrorsModel.{method_name}()
-                }}
-            }}
-            """
-
-            with tempfile.NamedTemporaryFile(mode='w', suffix='.qml', delete=False) as f:
-                f.write(qml_content)
-                qml_path = f.name
-
-            try:
-                error_map = {
-                    "cause_runtime_error": (RuntimeError, "Database connection failed"),
-                    "cause_memory_error": (MemoryError, "Out of memory"),
-                    "cause_os_error": (OSError, "File system error"),
-                    "cause_import_error": (ImportError, "Module not found"),
-                }
-                exc_type, exc_msg = error_map[method_name]
-                with pytest.raises(exc_type, match=exc_msg):
-                    self.engine.load(QUrl.fromLocalFile(qml_path))
-                    qtbot.waitUntil(lambda: bool(self.engine.rootObjects()), timeout=2000)
-
-                # Check that this specific error type generates critical messages
-                warning_messages = self.get_qtbridge_messages(QtMsgType.QtWarningMsg)
-                critical_messages = self.get_qtbridge_messages(QtMsgType.QtCriticalMsg)
-
-                # Should have critical messages for system errors
-                method_criticals = [msg for msg in critical_messages
-                                  if method_name in msg['message'] or
-                                     any(error_type in msg['message'] for error_type in
-                                         ['RuntimeError', 'MemoryError', 'OSError', 'ImportError'])]
-                assert len(method_criticals) > 0, f"Expected critical message for {method_name}, got criticals: {critical_messages}"
-
-                # Should NOT have warnings for system errors (they should be critical)
-                method_warnings = [msg for msg in warning_messages
-                                 if method_name in msg['message']]
-                assert len(method_warnings) == 0, f"System error {method_name} should not generate warnings, got: {method_warnings}"
-
-            finally:
-                os.unlink(qml_path)
-
-    def test_debug_vs_release_message_format(self, qtbot):
+    def test_debug_vs_release_message_format(self, qtbot, engine):
         """Test that debug builds show more detailed messages than release builds"""
         self.setup_message_capture()
 
@@ -328,31 +293,23 @@ class TestErrorHandling:
         }
         """
 
-        with tempfile.NamedTemporaryFile(mode='w', suffix='.qml', delete=False) as f:
-            f.write(qml_content)
-            qml_path = f.name
+        with pytest.raises(ValueError, match="Test error for format checking"):
+            with qtbot.waitSignal(engine.objectCreated, timeout=2000):
+                engine.loadData(qml_content.encode('utf-8'), QUrl())
 
-        try:
-            with pytest.raises(ValueError, match="Test error for format checking"):
-                self.engine.load(QUrl.fromLocalFile(qml_path))
-                qtbot.waitUntil(lambda: bool(self.engine.rootObjects()), timeout=2000)
-
-            warning_messages = self.get_qtbridge_messages(QtMsgType.QtWarningMsg)
+        warning_messages = self._by_type[QtMsgType.QtWarningMsg]
 
-            assert len(warning_messages) > 0, "Expected warning message for ValueError"
+        assert len(warning_messages) > 0, "Expected warning message for ValueError"
 
-            # Check if we're in debug build based on message content
-            error_msg = warning_messages[0]['message']
+        # Check if we're in debug build based on message content
+        error_msg = warning_messages[0].message
 
-            if 'Traceback' in error_msg or 'File "' in error_msg:
-                print("DEBUG BUILD: Message includes traceback information")
-                assert 'ValueError: Test error for format checking' in error_msg
-            else:
-                print(f'RELEASE BUILD: Message is simplified: "{error_msg}"')
-                assert 'Test error for format checking' in error_msg
-
-        finally:
-            os.unlink(qml_path)
+        if 'Traceback' in error_msg or 'File "' in error_msg:
+            print("DEBUG BUILD: Message includes traceback information")
+            assert 'ValueError: Test error for format checking' in error_msg
+        else:
+            print(f'RELEASE BUILD: Message is simplified: "{error_msg}"')
+            assert 'Test error for format checking' in error_msg
 
     def test_bridge_instance_infer_data_type_empty_data(self, qtbot):
         """Test that bridge_instance raises an error when data() has no type hint and
@@ -4,7 +4,6 @@
 import sys
 import pytest
 from PySide6.QtCore import QUrl, qInstallMessageHandler
-from PySide6.QtQml import QQmlApplicationEngine
 
 from QtBridge import bridge_instance, bridge_type, reset
 
@@ -25,16 +24,18 @@ class TestMethodReturn:
 
     def setup_method(self):
         """Setup for each test method"""
-        self.captured_messages = []
+        # Console messages, with "qml:" lines already left out
+        self._console = []
 
     def teardown_method(self):
         """Cleanup after each test"""
         qInstallMessageHandler(None)
-        self.captured_messages.clear()
+        self._console.clear()
 
     def message_handler(self, msg_type, context, message):
         """Capture console messages from QML"""
-        self.captured_messages.append(message)
+        if not message.startswith("qml:"):
+            self._console.append(message)
 
     def setup_message_capture(self):
         """Setup message handler to capture QML console output"""
@@ -42,9 +43,9 @@ class TestMethodReturn:
 
     def get_console_messages(self):
         """Get all captured console messages"""
-        return [msg for msg in self.captured_messages if not msg.startswith("qml:")]
+        return self._console
 
-    def test_property_returns_model(self, qtbot):
+    def test_property_returns_model(self, qtbot, engine):
         """Test that properties returning registered Python objects work in QML"""
         class UserResource:
             def __init__(self):
@@ -87,17 +88,16 @@ Item {
 """
 
         self.setup_message_capture()
-        engine = QQmlApplicationEngine()
         engine.loadData(qml.encode('utf-8'), QUrl())
 
         # Wait for QML to load
-        qtbot.waitUntil(lambda: len(self.get_console_messages()) >= 3, timeout=3000)
+        qtbot.waitUntil(lambda: len(self._console) >= 3, timeout=3000)
 
         messages = self.get_console_messages()
         assert any("ListView count: 3" in msg for msg in messages), \
             f"Expected ListView count message, got: {messages}"
 
-    def test_method_returns_model(self, qtbot):
+    def test_method_returns_model(self, qtbot, engine):
         """Test that a public method returning a registered model works in QML ListView"""
         class UserResource:
             def __init__(self):
@@ -139,11 +139,10 @@ Item {
 """
 
         self.setup_message_capture()
-        engine = QQmlApplicationEngine()
         engine.loadData(qml.encode('utf-8'), QUrl())
 
         # Wait for QML to load
-        qtbot.waitUntil(lambda: len(self.get_console_messages()) >= 3, timeout=3000)
+        qtbot.waitUntil(lambda: len(self._console) >= 3, timeout=3000)
 
         messages = self.get_console_messages()
         assert any("ListView count: 3" in msg for msg in messages), \
@@ -3,78 +3,52 @@
 
 import pytest
 from PySide6.QtCore import QUrl, qInstallMessageHandler
-from PySide6.QtQml import QQmlApplicationEngine
 from QtBridge import bridge_type
 from typing import List, Any
 
-class TestNestedTypesList:
-    """Test PyQmlListProperty with nested types through default_property"""
 
-    def setup_method(self):
-        """Setup for each test method"""
-        self.captured_messages = []
-        self.engine = None
-
-    def teardown_method(self):
-        """Cleanup after each test method"""
-        if self.engine:
-            del self.engine
-            self.engine = None
-        qInstallMessageHandler(None)
+# Minimal Widget and Box classes with type hints
+class Widget:
+    __slots__ = ("_text",)
 
-    def message_handler(self, msg_type, context, message):
-        """Capture console messages from QML"""
-        self.captured_messages.append(message)
+    def __init__(self) -> None:
+        self._text: str = "Default"
 
-    def get_console_messages(self):
-        """Get all captured console messages"""
-        return [msg for msg in self.captured_messages if not msg.startswith("qml:")]
+    @property
+    def text(self) -> str:
+        return self._text
 
-    def test_nested_widgets_qml_assignment(self, qtbot):
-        """Test PyQmlListProperty with nested widgets through QML.
-           If this works, it shows that atFunction() and appendFunction() are working correctly."""
-
-        # Minimal Widget and Box classes with type hints
+    @text.setter
+    def text(self, value: str) -> None:
+        self._text = value
 
-        class Widget:
-            def __init__(self) -> None:
-                self._text: str = "Default"
 
-            @property
-            def text(self) -> str:
-                return self._text
+class Box:
+    __slots__ = ("_children",)
 
-            @text.setter
-            def text(self, value: str) -> None:
-                self._text = value
+    def __init__(self) -> None:
+        self._children: List[Widget] = []
 
-        class Box:
-            def __init__(self) -> None:
-                self._children: List[Widget] = []
+    @property
+    def children(self) -> List[Widget]:
+        return self._children
 
-            @property
-            def children(self) -> List[Widget]:
-                return self._children
+    @children.setter
+    def children(self, value: Any) -> None:
+        if isinstance(value, list):
+            self._children = value
+        else:
+            self._children.append(value)
 
-            @children.setter
-            def children(self, value: Any) -> None:
-                if isinstance(value, list):
-                    self._children = value
-                else:
-                    self._children.append(value)
+    def count(self) -> int:
+        return len(self._children)
 
-            def count(self) -> int:
-                return len(self._children)
+    def has_children(self) -> bool:
+        return len(self._children) > 0
 
-            def has_children(self) -> bool:
-                return len(self._children) > 0
 
-        # Register types
-        bridge_type(Widget, uri="test.nested.widgets", version="1.0")
-        bridge_type(Box, uri="test.nested.widgets", version="1.0", default_property="children")
-
-        # Test QML snippet with nested widgets
-        qml_content = """
+# QML with three Widgets nested in a Box through its default property
+QML_NESTED_WIDGETS = b"""
 import QtQuick 2.15
 import test.nested.widgets 1.0
 
@@ -105,81 +79,10 @@ Item {
 }
 """
 
-        # Install message handler to capture console output
-        qInstallMessageHandler(self.message_handler)
-
-        engine = QQmlApplicationEngine()
-        engine.loadData(qml_content.encode(), QUrl())
-
-        # Wait a bit for Component.onCompleted to execute
-        qtbot.wait(100)
-
-        # Verify the console output shows the PyQmlListProperty functionality worked
-        messages = self.get_console_messages()
-
-        # Check that we got the expected console messages for nested list functionality
-        test_start_msg = any("PyQmlListProperty Nested Test" in msg for msg in messages)
-        children_count_msg = any("Box children count: 3" in msg for msg in messages)
-        has_children_msg = any("Box has children: true" in msg for msg in messages)
-        first_child_msg = any("First child text: A" in msg for msg in messages)
-        second_child_msg = any("Second child text: B" in msg for msg in messages)
-        third_child_msg = any("Third child text: C" in msg for msg in messages)
-        children_length_msg = any("Children length: 3" in msg for msg in messages)
-        test_complete_msg = any("Test Complete" in msg for msg in messages)
-
-        assert test_start_msg, f"Expected test start message. Got: {messages}"
-        assert children_count_msg, f"Expected 'Box children count: 3' message. Got: {messages}"
-        assert has_children_msg, f"Expected 'Box has children: true' message. Got: {messages}"
-        assert first_child_msg, f"Expected 'First child text: A' message. Got: {messages}"
-        assert second_child_msg, f"Expected 'Second child text: B' message. Got: {messages}"
-        assert third_child_msg, f"Expected 'Third child text: C' message. Got: {messages}"
-        assert children_length_msg, f"Expected 'Children length: 3' message. Got: {messages}"
-        assert test_complete_msg, f"Expected test complete message. Got: {messages}"
-
-    def test_clear_and_count_functions_with_signals(self, qtbot):
-        """Test PyQmlListProperty clearFunction() and countFunction() with property change signals"""
-
-        class Widget:
-            def __init__(self) -> None:
-                self._text: str = "Default"
-
-            @property
-            def text(self) -> str:
-                return self._text
-
-            @text.setter
-            def text(self, value: str) -> None:
-                self._text = value
-
-        class Box:
-            def __init__(self) -> None:
-                self._children: List[Widget] = []
-
-            @property
-            def children(self) -> List[Widget]:
-                return self._children
-
-            @children.setter
-            def children(self, value: Any) -> None:
-                if isinstance(value, list):
-                    self._children = value
-                else:
-                    self._children.append(value)
-
-            def count(self) -> int:
-                return len(self._children)
-
-            def has_children(self) -> bool:
-                return len(self._children) > 0
-
-        # Register types
-        bridge_type(Widget, uri="test.nested.clear", version="1.0")
-        bridge_type(Box, uri="test.nested.clear", version="1.0", default_property="children")
-
-        # Test QML snippet that tests clear function and count with signals
-        qml_content = """
+# QML that clears and refills the Box children, watching the change signal
+QML_CLEAR_AND_COUNT = b"""
 import QtQuick 2.15
-import test.nested.clear 1.0
+import test.nested.widgets 1.0
 
 Item {
     property Box testBox: Box {
@@ -190,6 +93,12 @@ Item {
 
     property int changeSignalCount: 0
 
+    // Compiled once, then instantiated for each child added back
+    Component {
+        id: widgetComponent
+        Widget { }
+    }
+
     // Connect to children property change signal
     Connections {
         target: testBox
@@ -218,8 +127,8 @@ Item {
         // Add some children back to test append
         console.log("Adding children back...")
         testBox.children = [
-            Qt.createQmlObject('import test.nested.clear 1.0; Widget { text: "New1" }', testBox, "widget1"),
-            Qt.createQmlObject('import test.nested.clear 1.0; Widget { text: "New2" }', testBox, "widget2")
+            widgetComponent.createObject(testBox, { "text": "New1" }),
+            widgetComponent.createObject(testBox, { "text": "New2" })
         ]
 
         // Test count after adding back
@@ -238,54 +147,115 @@ Item {
 }
 """
 
-        # Install message handler to capture console output
-        qInstallMessageHandler(self.message_handler)
+# Console lines test_nested_widgets_qml_assignment expects
+NESTED_NEEDLES = (
+    "PyQmlListProperty Nested Test",
+    "Box children count: 3",
+    "Box has children: true",
+    "First child text: A",
+    "Second child text: B",
+    "Third child text: C",
+    "Children length: 3",
+    "Test Complete",
+)
+
+# Console lines test_clear_and_count_functions_with_signals expects
+CLEAR_NEEDLES = (
+    "Clear and Count Function Test",
+    "Initial children count: 3",
+    "Initial Python count(): 3",
+    "Clearing children array",
+    "After clear - children count: 0",
+    "After clear - Python count(): 0",
+    "After clear - has children: false",
+    "Adding children back",
+    "After re-adding - children count: 2",
+    "After re-adding - Python count(): 2",
+    "New first child text: New1",
+    "New second child text: New2",
+    # Property change signals were triggered
+    "Children changed signal received",
+    "Clear and Count Test Complete",
+)
+
+
+@pytest.fixture(scope="session")
+def nested_widget_types():
+    """Register Widget and Box once for the session and return their URI"""
+    uri = "test.nested.widgets"
+    bridge_type(Widget, uri=uri, version="1.0")
+    bridge_type(Box, uri=uri, version="1.0", default_property="children")
+    return uri
+
+
+# Messages are captured by the class-level handler, not by pytest-qt
+@pytest.mark.no_qt_log
+class TestNestedTypesList:
+    """Test PyQmlListProperty with nested types through default_property"""
 
-        self.engine = QQmlApplicationEngine()
-        self.engine.loadData(qml_content.encode(), QUrl())
+    @classmethod
+    def setup_class(cls):
+        """Install one Qt message handler for the whole class"""
+        cls.captured_messages = []
+        append = cls.captured_messages.append
 
-        # Wait a bit for Component.onCompleted to execute
-        qtbot.wait(200)  # Longer wait for Qt.createQmlObject operations
+        def handler(msg_type, context, message):
+            # Drop "qml:" lines up front
+            if not message.startswith("qml:"):
+                append(message)
 
-        # Verify the console output shows the clear and count functionality worked
-        messages = self.get_console_messages()
+        qInstallMessageHandler(handler)
 
-        # Check that we got the expected console messages
-        test_start_msg = any("Clear and Count Function Test" in msg for msg in messages)
-        initial_count_msg = any("Initial children count: 3" in msg for msg in messages)
-        initial_python_count_msg = any("Initial Python count(): 3" in msg for msg in messages)
+    @classmethod
+    def teardown_class(cls):
+        """Remove the class-level message handler"""
+        qInstallMessageHandler(None)
 
-        clearing_msg = any("Clearing children array" in msg for msg in messages)
-        after_clear_count_msg = any("After clear - children count: 0" in msg for msg in messages)
-        after_clear_python_count_msg = any("After clear - Python count(): 0" in msg for msg in messages)
-        after_clear_has_children_msg = any("After clear - has children: false" in msg for msg in messages)
+    def setup_method(self):
+        """Setup for each test method"""
+        self.captured_messages.clear()
 
-        adding_back_msg = any("Adding children back" in msg for msg in messages)
-        after_readd_count_msg = any("After re-adding - children count: 2" in msg for msg in messages)
-        after_readd_python_count_msg = any("After re-adding - Python count(): 2" in msg for msg in messages)
+    def get_console_messages(self):
+        """Get all captured console messages"""
+        return self.captured_messages
+
+    @pytest.mark.usefixtures("nested_widget_types")
+    def test_nested_widgets_qml_assignment(self, qtbot, engine):
+        """Test PyQmlListProperty with nested widgets through QML.
+           If this works, it shows that atFunction() and appendFunction() are working correctly."""
+
+        engine.loadData(QML_NESTED_WIDGETS, QUrl())
 
-        new_first_child_msg = any("New first child text: New1" in msg for msg in messages)
-        new_second_child_msg = any("New second child text: New2" in msg for msg in messages)
+        # Wait for Component.onCompleted to finish
+        qtbot.waitUntil(
+            lambda: any("=== Test Complete" in msg for msg in self.captured_messages),
+            timeout=2000
+        )
 
-        # Check that property change signals were triggered
-        change_signal_msg = any("Children changed signal received" in msg for msg in messages)
-        test_complete_msg = any("Clear and Count Test Complete" in msg for msg in messages)
+        # Verify the console output shows the PyQmlListProperty functionality worked
+        messages = self.get_console_messages()
+
+        # Match every expected line in a single pass over the messages
+        hits = {needle for msg in messages for needle in NESTED_NEEDLES if needle in msg}
+        missing = [needle for needle in NESTED_NEEDLES if needle not in hits]
+        assert not missing, f"Missing expected messages {missing}. Got: {messages}"
 
-        assert test_start_msg, f"Expected test start message. Got: {messages}"
-        assert initial_count_msg, f"Expected 'Initial children count: 3' message. Got: {messages}"
-        assert initial_python_count_msg, f"Expected 'Initial Python count(): 3' message. Got: {messages}"
+    @pytest.mark.usefixtures("nested_widget_types")
+    def test_clear_and_count_functions_with_signals(self, qtbot, engine):
+        """Test PyQmlListProperty clearFunction() and countFunction() with property change signals"""
 
-        assert clearing_msg, f"Expected 'Clearing children array' message. Got: {messages}"
-        assert after_clear_count_msg, f"Expected 'After clear - children count: 0' message. Got: {messages}"
-        assert after_clear_python_count_msg, f"Expected 'After clear - Python count(): 0' message. Got: {messages}"
-        assert after_clear_has_children_msg, f"Expected 'After clear - has children: false' message. Got: {messages}"
+        engine.loadData(QML_CLEAR_AND_COUNT, QUrl())
 
-        assert adding_back_msg, f"Expected 'Adding children back' message. Got: {messages}"
-        assert after_readd_count_msg, f"Expected 'After re-adding - children count: 2' message. Got: {messages}"
-        assert after_readd_python_count_msg, f"Expected 'After re-adding - Python count(): 2' message. Got: {messages}"
+        # Wait for Component.onCompleted to finish
+        qtbot.waitUntil(
+            lambda: any("Clear and Count Test Complete" in msg for msg in self.captured_messages),
+            timeout=2000
+        )
 
-        assert new_first_child_msg, f"Expected 'New first child text: New1' message. Got: {messages}"
-        assert new_second_child_msg, f"Expected 'New second child text: New2' message. Got: {messages}"
+        # Verify the console output shows the clear and count functionality worked
+        messages = self.get_console_messages()
 
-        assert change_signal_msg, f"Expected property change signal messages. Got: {messages}"
-        assert test_complete_msg, f"Expected test complete message. Got: {messages}"
+        # Match every expected line in a single pass over the messages
+        hits = {needle for msg in messages for needle in CLEAR_NEEDLES if needle in msg}
+        missing = [needle for needle in CLEAR_NEEDLES if needle not in hits]
+        assert not missing, f"Missing expected messages {missing}. Got: {messages}"
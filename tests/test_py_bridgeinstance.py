@@ -2,14 +2,13 @@
 # SPDX-License-Identifier: LicenseRef-Qt-Commercial OR GPL-3.0-only
 
 from PySide6.QtCore import QUrl
-from PySide6.QtQml import QQmlApplicationEngine
 
 from qtbridge_py.autoqmlbridge import bridge_instance, _bridge_map
 
 import numpy as np
 import pytest
 
-TEST_QML_METHOD = """
+TEST_QML_METHOD = b"""
 import QtQuick 2.0
 import backend 1.0
 
@@ -27,76 +26,25 @@ Item {
 class TestAutoQmlBridge:
     """Test bridge_instance() method with python containers"""
 
-    def test_bridge_instance_with_list(self, qtbot, tmp_path):
-        """Test that bridge_instance registers a QRangeModel for list objects."""
-        test_list = [1, 2, 3]
-        bridge_instance(test_list, name="Test_model")
-
-        engine = QQmlApplicationEngine()
-
-        # Write QML to temporary file
-        qml_file = tmp_path / "test.qml"
-        qml_file.write_text(TEST_QML_METHOD)
-
-        # Load QML
-        engine.load(QUrl.fromLocalFile(str(qml_file)))
-
-        # Wait for QML to load
-        qtbot.waitUntil(lambda: bool(engine.rootObjects()))
-
-        model = _bridge_map["model"]
-
-        assert model is not None
-        assert model.rowCount() == 3
-        assert model.data(model.index(0, 0)) == 1
-        assert model.data(model.index(1, 0)) == 2
-        assert model.data(model.index(2, 0)) == 3
-
-    def test_bridge_instance_with_tuple(self, qtbot, tmp_path):
-        """Test that bridge_instance registers a QRangeModel for list objects."""
-        test_tuple = ("apple", "orange", "grape", "banana")
-        bridge_instance(test_tuple, "Test_model")
-
-        engine = QQmlApplicationEngine()
-
-        # Write QML to temporary file
-        qml_file = tmp_path / "test.qml"
-        qml_file.write_text(TEST_QML_METHOD)
+    @pytest.mark.parametrize("container,expected", [
+        ([1, 2, 3], [[1], [2], [3]]),
+        (("apple", "orange", "grape", "banana"), [["apple"], ["orange"], ["grape"], ["banana"]]),
+        (np.array([[10, 20], [30, 40]]), [[10, 20], [30, 40]]),
+    ], ids=["list", "tuple", "numpy_array"])
+    def test_bridge_instance_with_container(self, qtbot, engine, container, expected):
+        """Test that bridge_instance registers a QRangeModel for lists, tuples and numpy arrays."""
+        bridge_instance(container, "Test_model")
 
         # Load QML
-        engine.load(QUrl.fromLocalFile(str(qml_file)))
+        engine.loadData(TEST_QML_METHOD, QUrl())
 
         # Wait for QML to load
         qtbot.waitUntil(lambda: bool(engine.rootObjects()))
 
-        model = _bridge_map["model"]
-
-        assert model is not None
-        assert model.rowCount() == 4
-        assert model.data(model.index(0, 0)) == "apple"
-        assert model.data(model.index(1, 0)) == "orange"
-        assert model.data(model.index(2, 0)) == "grape"
-        assert model.data(model.index(3, 0)) == "banana"
-
-    def test_bridge_instance_with_numpy_array(self, qtbot, tmp_path):
-        """Test that bridge_instance registers a QRangeModel for numpy arrays."""
-        test_array = np.array([[10, 20], [30, 40]])
-        bridge_instance(test_array, "Test_model")
-
-        engine = QQmlApplicationEngine()
-
-        qml_file = tmp_path / "test.qml"
-        qml_file.write_text(TEST_QML_METHOD)
-
-        engine.load(QUrl.fromLocalFile(str(qml_file)))
-
-        qtbot.waitUntil(lambda: bool(engine.rootObjects()))
-
-        model = _bridge_map["model"]
+        model = _bridge_map[("backend", "Test_model")]
 
         assert model is not None
-        assert model.rowCount() == 2
-        assert model.data(model.index(0, 0)) == 10
-        assert model.data(model.index(0, 1)) == 20
-        assert model.data(model.index(1, 0)) == 30
-        assert model.data(model.index(1, 1)) == 40
+        assert model.rowCount() == len(expected)
+        for row, values in enumerate(expected):
+            for column, value in enumerate(values):
+                assert model.data(model.index(row, column)) == value
@@ -3,7 +3,6 @@
 
 from PySide6.QtCore import QTimer, QCoreApplication, qInstallMessageHandler
 from PySide6.QtQml import QQmlApplicationEngine
-import sys
 
 from qtbridge_py.qtbridge import qtbridge
 
@@ -66,6 +65,18 @@ class TestQtBridge:
         with pytest.raises(ValueError, match="Either 'qml_file' or 'module' must be specified."):
             dummy_func()
 
+    def test_qtbridge_raises_if_qml_fails_to_load(self, qtbot, tmp_path):
+        """Test qtbridge raises if the QML file does not produce a root object."""
+        qml_file = tmp_path / "broken.qml"
+        qml_file.write_text("import QtQuick 2.0\nItem {")
+
+        @qtbridge(qml_file=qml_file)
+        def dummy_func():
+            pass
+
+        with pytest.raises(RuntimeError, match="Failed to load QML"):
+            dummy_func()
+
     def test_qtbridge_loads_module(self, qtbot, tmp_path):
         """Test qtbridge loads module."""
 
@@ -74,9 +85,7 @@ class TestQtBridge:
         (module_dir / "qmldir").write_text("dummyType 1.0 dummyType.qml\n")
         (module_dir / "dummyType.qml").write_text(TEST_QML_METHOD)
 
-        sys.path.insert(0, str(tmp_path))
-
-        @qtbridge(module="testPath.DummyModule", type_name="dummyType")
+        @qtbridge(module="testPath.DummyModule", type_name="dummyType", import_paths=[str(tmp_path)])
         def dummy_func():
             pass
 
@@ -84,7 +93,6 @@ class TestQtBridge:
         QTimer.singleShot(0, lambda: QCoreApplication.exit(42))
 
         result = dummy_func()
-        sys.path.remove(str(tmp_path))
         assert result == 42
 
     def test_qtbridge_loads_qml_relative_path(self, qtbot, tmp_path):
@@ -1,22 +1,151 @@
 # Copyright (C) 2025 The Qt Company Ltd.
 # SPDX-License-Identifier: LicenseRef-Qt-Commercial OR GPL-3.0-only
 
-import os
+import collections
+import re
+
 import pytest
-import tempfile
 from PySide6.QtCore import QUrl, qInstallMessageHandler
-from PySide6.QtQml import QQmlApplicationEngine
 
 from QtBridge import bridge_instance, bridge_type, insert, remove, move, edit, reset, complete
 
+from conftest import LogRecord
+
+
+class QAIMTestModel:
+    """Model with every QAIM decorator, shared by the remove/move/edit/reset tests"""
+
+    def __init__(self):
+        self._items = ["A", "B", "C"]
+
+    @reset
+    def configure(self, items):
+        """Replace the contents before each test"""
+        self._items = list(items)
+        return True
+
+    @remove
+    def remove_item(self, index: int):
+        self._items.pop(index)
+        return True
+
+    @move
+    def move_item(self, from_index: int, to_index: int):
+        item = self._items.pop(from_index)
+        self._items.insert(to_index, item)
+        return True
+
+    @edit
+    def edit_item(self, index: int, value: str):
+        self._items[index] = value
+        return True
+
+    @reset
+    def reset_model(self):
+        self._items = ["X", "Y"]
+        return True
+
+    def data(self):
+        return self._items
+
+
+@pytest.fixture(scope="module")
+def qaim_model():
+    """QAIMTestModel singleton, registered once for all cases that use it"""
+    model = QAIMTestModel()
+    bridge_instance(model, name="QAIMModel")
+    yield model
+
+
+class InitializableComponent:
+    def __init__(self):
+        self._initialized = False
+        self._init_count = 0
+
+    @property
+    def initialized(self) -> bool:
+        return self._initialized
+
+    @initialized.setter
+    def initialized(self, value: bool) -> None:
+        self._initialized = value
+
+    @property
+    def initCount(self) -> int:
+        return self._init_count
+
+    @complete
+    def componentComplete(self) -> None:
+        """This should be called automatically when QML component is complete"""
+        print(
+            f"@complete: componentComplete called, count before: {self._init_count}",
+            flush=True
+        )
+        self._initialized = True
+        self._init_count += 1
+        print(
+            f"@complete: componentComplete finished, initialized={self._initialized}, "
+            f"count={self._init_count}",
+            flush=True
+        )
+
+    def getData(self) -> str:
+        """Return initialization status"""
+        return f"Initialized: {self._initialized}, Count: {self._init_count}"
+
+
+class ServiceComponent:
+    def __init__(self):
+        self._ready = False
+        self._status = "Not initialized"
+
+    @property
+    def ready(self) -> bool:
+        return self._ready
+
+    @ready.setter
+    def ready(self, value: bool) -> None:
+        self._ready = value
+
+    @property
+    def status(self) -> str:
+        return self._status
+
+    @status.setter
+    def status(self, value: str) -> None:
+        self._status = value
+
+    @complete
+    def initialize(self) -> None:
+        """Initialize the service on component complete"""
+        print("@complete: Initializing service", flush=True)
+        self.ready = True
+        self.status = "Initialized and ready"
+        print(
+            f"@complete: Service initialized, ready={self._ready}, status={self._status}",
+            flush=True
+        )
+
+    def getInfo(self) -> str:
+        return f"Ready: {self._ready}, Status: {self._status}"
+
+
+@pytest.fixture(scope="module")
+def complete_types():
+    """Register the @complete test types once per module, each under its own URI"""
+    bridge_type(InitializableComponent, uri="test.complete.basic", version="1.0")
+    bridge_type(ServiceComponent, uri="test.complete.properties", version="1.0")
+
 
 class TestQAIMDecorators:
     """Test QAbstractItemModel decorators (@insert, @remove, @move, @edit) behavior"""
 
+    _QTBRIDGE_RE = re.compile(r"(?i:qtbridges)|@remove|@insert|@move|@edit|qt_metacall")
+
     def setup_method(self):
         """Setup that runs before each test method"""
-        self.engine = QQmlApplicationEngine()
-        self.captured_messages = []
+        # Bounded, so a burst of engine warnings cannot grow it without limit
+        self.captured_messages = collections.deque(maxlen=8192)
         self.original_handler = None
 
     def teardown_method(self):
@@ -26,11 +155,7 @@ class TestQAIMDecorators:
 
     def message_handler(self, msg_type, context, message):
         """Custom Qt message handler to capture log messages"""
-        self.captured_messages.append({
-            'type': msg_type,
-            'message': message,
-            'context': context
-        })
+        self.captured_messages.append(LogRecord(msg_type, message))
 
     def setup_message_capture(self):
         """Setup Qt message handler to capture log messages"""
@@ -38,20 +163,12 @@ class TestQAIMDecorators:
 
     def get_qtbridge_messages(self, msg_type=None):
         """Get captured QtBridge log messages, optionally filtered by type"""
-        messages = [msg for msg in self.captured_messages if
-                   ('qtbridges' in msg['message'].lower() or
-                    '@remove' in msg['message'] or
-                    '@insert' in msg['message'] or
-                    '@move' in msg['message'] or
-                    '@edit' in msg['message'] or
-                    'qt_metacall' in msg['message'])]
-        if msg_type:
-            messages = [msg for msg in messages if msg['type'] == msg_type]
-        return messages
-
-    def test_insert_with_string_index_appends_gracefully(self, qtbot):
+        search = self._QTBRIDGE_RE.search
+        return [msg for msg in self.captured_messages
+                if search(msg.message) and (not msg_type or msg.type == msg_type)]
+
+    def test_insert_with_string_index_appends_gracefully(self, qtbot, engine):
         """Test that passing a string index to @insert decorator"""
-        self.setup_message_capture()
 
         class StringIndexModel:
             def __init__(self):
@@ -83,23 +200,13 @@ class TestQAIMDecorators:
         }
         """
 
-        with tempfile.NamedTemporaryFile(mode='w', suffix='.qml', delete=False) as f:
-            f.write(qml_content)
-            qml_path = f.name
-
-        try:
-            with pytest.raises(TypeError, match="cannot be interpreted as an integer"):
-                self.engine.load(QUrl.fromLocalFile(qml_path))
-                qtbot.waitUntil(lambda: bool(self.engine.rootObjects()), timeout=2000)
+        with pytest.raises(TypeError, match="cannot be interpreted as an integer"):
+            engine.loadData(qml_content.encode(), QUrl())
 
-            assert model.items == ["A", "B"], "No item should be appended if TypeError is raised"
+        assert model.items == ["A", "B"], "No item should be appended if TypeError is raised"
 
-        finally:
-            os.unlink(qml_path)
-
-    def test_insert_with_valid_numeric_index(self, qtbot):
+    def test_insert_with_valid_numeric_index(self, qtbot, engine):
         """Test that @insert works correctly with valid numeric index"""
-        self.setup_message_capture()
 
         class NumericIndexModel:
             def __init__(self):
@@ -131,20 +238,12 @@ class TestQAIMDecorators:
         }
         """
 
-        with tempfile.NamedTemporaryFile(mode='w', suffix='.qml', delete=False) as f:
-            f.write(qml_content)
-            qml_path = f.name
+        engine.loadData(qml_content.encode(), QUrl())
+        qtbot.waitUntil(lambda: bool(engine.rootObjects()), timeout=2000)
 
-        try:
-            self.engine.load(QUrl.fromLocalFile(qml_path))
-            qtbot.waitUntil(lambda: bool(self.engine.rootObjects()), timeout=2000)
-
-            # Should insert at the specified index
-            expected = ["First", "Middle", "Last"]
-            assert model.data() == expected
-
-        finally:
-            os.unlink(qml_path)
+        # Should insert at the specified index
+        expected = ["First", "Middle", "Last"]
+        assert model.data() == expected
 
     def test_decorator_parameter_validation_basic(self, qtbot):
         """Test basic decorator parameter validation and graceful handling"""
@@ -195,285 +294,75 @@ class TestQAIMDecorators:
         assert model.data()[0] == "Item1"
 
 
-    def test_remove_with_valid_index(self, qtbot):
-        """Test @remove called from QML with valid index removes item"""
-
-        class RemoveModel:
-            def __init__(self):
-                self._items = ["A", "B"]
-            @remove
-            def remove_item(self, index: int):
-                self._items.pop(index)
-                return True
-            def data(self):
-                return self._items
-
-        model = RemoveModel()
-        bridge_instance(model, name="RemoveModel")
-
-        qml_content = """
-        import QtQuick 2.0
-        import backend 1.0
-        Item { Component.onCompleted: { RemoveModel.remove_item(1) } }
-        """
-
-        with tempfile.NamedTemporaryFile(mode='w', suffix='.qml', delete=False) as f:
-            f.write(qml_content)
-            qml_path = f.name
-        try:
-            self.engine.load(QUrl.fromLocalFile(qml_path))
-            qtbot.wait(100)
-            assert model.data() == ["A"], "Item at index 1 should be removed"
-        finally:
-            os.unlink(qml_path)
-
-    def test_remove_qml_invalid_index(self, qtbot):
-        """Test @remove called from QML with string index fails gracefully and logs error"""
-
-        class RemoveModel:
-            def __init__(self):
-                self._items = ["A", "B", "C"]
-
-            @remove
-            def remove_item(self, index: int):
-                self._items.pop(index)
-                return True
-
-            def data(self):
-                return self._items
-
-        model = RemoveModel()
-        bridge_instance(model, name="RemoveModelQML")
-
-        # QML content that passes string value instead of integer
-        qml_content = """
-        import QtQuick 2.0
-        import backend 1.0
-        Item {
-            Component.onCompleted: {
-                // This should fail - passing string instead of integer
-                RemoveModelQML.remove_item("invalid_index")
-            }
-        }
-        """
-
-        with tempfile.NamedTemporaryFile(mode='w', suffix='.qml', delete=False) as f:
-            f.write(qml_content)
-            qml_path = f.name
-        try:
-            # Install message handler after engine is created, just before QML load
-            self.setup_message_capture()
-            with pytest.raises(TypeError, match=r"'str' object cannot be interpreted as an integer"):
-                self.engine.load(QUrl.fromLocalFile(qml_path))
-                qtbot.wait(100)
-
-            # Check that error was logged
-            error_msgs = self.get_qtbridge_messages()
-            found = any("@remove - Failed to convert" in msg['message'] or
-                       "index argument to long" in msg['message'] for msg in error_msgs)
-            assert found, "Expected error message for invalid string index from QML"
-
-            # Model data should remain unchanged
-            assert model.data() == ["A", "B", "C"], "Model should be unchanged when remove fails"
-        finally:
-            os.unlink(qml_path)
-
-    def test_move_with_valid_indices(self, qtbot):
-        """Test @move called from QML with valid indices moves item"""
-
-        class MoveModel:
-            def __init__(self):
-                self._items = ["A", "B", "C"]
-
-            @move
-            def move_item(self, from_index: int, to_index: int):
-                item = self._items.pop(from_index)
-                self._items.insert(to_index, item)
-                return True
-
-            def data(self):
-                return self._items
-
-        model = MoveModel()
-        bridge_instance(model, name="MoveModel")
+    @pytest.mark.parametrize("initial,call,expected", [
+        (["A", "B"], "remove_item(1)", ["A"]),
+        (["A", "B", "C"], "move_item(0, 2)", ["B", "C", "A"]),
+        (["A", "B"], 'edit_item(1, "X")', ["A", "X"]),
+        (["A", "B", "C"], "reset_model()", ["X", "Y"]),
+    ], ids=["remove", "move", "edit", "reset"])
+    def test_decorator_called_from_qml(self, qtbot, engine, qaim_model, initial, call, expected):
+        """Test @remove, @move, @edit and @reset called from QML with valid arguments"""
+        qaim_model.configure(initial)
 
-        qml_content = """
+        qml_content = f"""
         import QtQuick 2.0
         import backend 1.0
-        Item { Component.onCompleted: { MoveModel.move_item(0, 2) } }
+        Item {{ Component.onCompleted: {{ QAIMModel.{call} }} }}
         """
 
-        with tempfile.NamedTemporaryFile(mode='w', suffix='.qml', delete=False) as f:
-            f.write(qml_content)
-            qml_path = f.name
-        try:
-            self.engine.load(QUrl.fromLocalFile(qml_path))
-            qtbot.wait(100)
-            assert model.data() == ["B", "C", "A"], "Item should be moved from 0 to 2"
-        finally:
-            os.unlink(qml_path)
-
-    def test_move_qml_invalid_indices(self, qtbot):
-        """Test @move called from QML with string indices fails gracefully and logs error"""
-        class MoveModel:
-            def __init__(self):
-                self._items = ["A", "B", "C"]
+        engine.loadData(qml_content.encode(), QUrl())
+        qtbot.waitUntil(lambda: bool(engine.rootObjects()), timeout=2000)
+        assert qaim_model.data() == expected, f"Unexpected model data after {call}"
 
-            @move
-            def move_item(self, from_index: int, to_index: int):
-                item = self._items.pop(from_index)
-                self._items.insert(to_index, item)
-                return True
+    @pytest.mark.parametrize("call,log_re", [
+        ('remove_item("invalid_index")', re.compile(r"@remove - Failed to convert|index argument to long")),
+        ('move_item("invalid", "also_invalid")', re.compile(r"@move.*Failed to convert")),
+    ], ids=["remove", "move"])
+    def test_decorator_qml_invalid_indices(self, qtbot, engine, qaim_model, call, log_re):
+        """Test @remove and @move called from QML with string indices fail gracefully and log an error"""
+        qaim_model.configure(["A", "B", "C"])
 
-            def data(self):
-                return self._items
-
-        model = MoveModel()
-        bridge_instance(model, name="MoveModelQML")
-
-        # QML content that passes string values instead of integers
-        qml_content = """
+        # QML content that passes strings instead of integers
+        qml_content = f"""
         import QtQuick 2.0
         import backend 1.0
-        Item {
-            Component.onCompleted: {
-                // This should fail - passing strings instead of integers
-                MoveModelQML.move_item("invalid", "also_invalid")
-            }
-        }
+        Item {{
+            Component.onCompleted: {{
+                QAIMModel.{call}
+            }}
+        }}
         """
 
-        with tempfile.NamedTemporaryFile(mode='w', suffix='.qml', delete=False) as f:
-            f.write(qml_content)
-            qml_path = f.name
-        try:
-            # Install message handler to capture error logs
-            self.setup_message_capture()
-            with pytest.raises(TypeError, match=r"'str' object cannot be interpreted as an integer"):
-                self.engine.load(QUrl.fromLocalFile(qml_path))
-                qtbot.wait(100)
-
-            # Check that error was logged
-            error_msgs = self.get_qtbridge_messages()
-            found = any("@move" in msg['message'] and "Failed to convert" in msg['message'] for msg in error_msgs)
-            assert found, "Expected error message for invalid string indices from QML"
-
-            # Model data should remain unchanged
-            assert model.data() == ["A", "B", "C"], "Model should be unchanged when move fails"
-        finally:
-            os.unlink(qml_path)
-
-    def test_edit_with_valid_arguments(self, qtbot):
-        """Test @edit called from QML with valid arguments edits item"""
-        class EditModel:
-            def __init__(self):
-                self._items = ["A", "B"]
-
-            @edit
-            def edit_item(self, index: int, value: str):
-                self._items[index] = value
-                return True
+        # Install message handler after engine is created, just before QML load
+        self.setup_message_capture()
+        with pytest.raises(TypeError, match=r"'str' object cannot be interpreted as an integer"):
+            engine.loadData(qml_content.encode(), QUrl())
 
-            def data(self):
-                return self._items
+        # Check that error was logged
+        error_msgs = self.get_qtbridge_messages()
+        found = any(log_re.search(msg.message) for msg in error_msgs)
+        assert found, f"Expected error message for invalid string indices passed to {call}"
 
-        model = EditModel()
-        bridge_instance(model, name="EditModel")
+        # Model data should remain unchanged
+        assert qaim_model.data() == ["A", "B", "C"], f"Model should be unchanged when {call} fails"
 
-        qml_content = """
-        import QtQuick 2.0
-        import backend 1.0
-        Item { Component.onCompleted: { EditModel.edit_item(1, "X") } }
-        """
-
-        with tempfile.NamedTemporaryFile(mode='w', suffix='.qml', delete=False) as f:
-            f.write(qml_content)
-            qml_path = f.name
-        try:
-            self.engine.load(QUrl.fromLocalFile(qml_path))
-            qtbot.wait(100)
-            assert model.data() == ["A", "X"], "Item at index 1 should be edited to 'X'"
-        finally:
-            os.unlink(qml_path)
-
-    def test_edit_python_missing_arguments(self, qtbot):
+    def test_edit_python_missing_arguments(self, qtbot, qaim_model):
         """Test @edit called directly from Python with missing arguments raises TypeError and logs expected message"""
-        class EditModel:
-            def __init__(self):
-                self._items = ["A", "B"]
-
-            @edit
-            def edit_item(self, index: int, value: str):
-                self._items[index] = value
-                return True
-
-            def data(self):
-                return self._items
-
-        model = EditModel()
-        bridge_instance(model, name="EditModelPy")
+        qaim_model.configure(["A", "B"])
 
         # Missing value argument
         with pytest.raises(ValueError):
-            model.edit_item(0)
+            qaim_model.edit_item(0)
 
-        assert model.data() == ["A", "B"], "No item should be edited if argument is missing"
+        assert qaim_model.data() == ["A", "B"], "No item should be edited if argument is missing"
 
-    def test_edit_python_invalid_index(self, qtbot):
+    def test_edit_python_invalid_index(self, qtbot, qaim_model):
         """Test @edit called directly from Python with invalid index raises TypeError and logs expected message"""
-
-        class EditModel:
-            def __init__(self):
-                self._items = ["A", "B"]
-
-            @edit
-            def edit_item(self, index: int, value: str):
-                self._items[index] = value
-                return True
-
-            def data(self):
-                return self._items
-
-        model = EditModel()
-        bridge_instance(model, name="EditModelPy")
+        qaim_model.configure(["A", "B"])
 
         # Invalid index argument (string instead of int)
         with pytest.raises(TypeError):
-            model.edit_item("not_an_int", "X")
-
-    def test_reset_qml(self, qtbot):
-        """Test @reset called from QML resets all data in the model correctly"""
-
-        class ResetModel:
-            def __init__(self):
-                self._items = ["A", "B", "C"]
-
-            @reset
-            def reset_model(self):
-                self._items = ["X", "Y"]
-                return True
-
-            def data(self):
-                return self._items
-
-        model = ResetModel()
-        bridge_instance(model, name="ResetModel")
-
-        qml_content = """
-        import QtQuick 2.0
-        import backend 1.0
-        Item { Component.onCompleted: { ResetModel.reset_model() } }
-        """
-
-        with tempfile.NamedTemporaryFile(mode='w', suffix='.qml', delete=False) as f:
-            f.write(qml_content)
-            qml_path = f.name
-        try:
-            self.engine.load(QUrl.fromLocalFile(qml_path))
-            qtbot.wait(100)
-            assert model.data() == ["X", "Y"], "Model should be reset with new data"
-        finally:
-            os.unlink(qml_path)
+            qaim_model.edit_item("not_an_int", "X")
 
     def test_reset_python(self, qtbot):
         """Test @reset called directly from Python resets the model correctly"""
@@ -497,7 +386,7 @@ class TestQAIMDecorators:
         assert result is True, "Reset method should return True"
         assert model.data() == [], "Model should be empty after reset"
 
-    def test_reset_with_bridge_type(self, qtbot):
+    def test_reset_with_bridge_type(self, qtbot, engine):
         """Test @reset works correctly with bridge_type registration"""
 
         class ResetTypeModel:
@@ -523,16 +412,10 @@ class TestQAIMDecorators:
         }
         """
 
-        with tempfile.NamedTemporaryFile(mode='w', suffix='.qml', delete=False) as f:
-            f.write(qml_content)
-            qml_path = f.name
-        try:
-            self.engine.load(QUrl.fromLocalFile(qml_path))
-            qtbot.wait(100)
-            # Note: We can't directly check the model data in this case
-            # since we don't have a direct reference to the QML-created instance
-        finally:
-            os.unlink(qml_path)
+        engine.loadData(qml_content.encode(), QUrl())
+        qtbot.waitUntil(lambda: bool(engine.rootObjects()), timeout=2000)
+        # Note: We can't directly check the model data in this case
+        # since we don't have a direct reference to the QML-created instance
 
     def test_reset_error_handling(self, qtbot):
         """Test @reset handles exceptions in the decorated method properly"""
@@ -589,49 +472,11 @@ class TestQAIMDecorators:
         assert result2 is None, "Should return None when method has no explicit return"
         assert model.data() == ["Empty"], "Model should be reset again"
 
-    def test_complete_decorator_with_bridge_type(self, qtbot, capsys):
+    @pytest.mark.usefixtures("complete_types")
+    def test_complete_decorator_with_bridge_type(self, qtbot, engine, capsys):
         """Test that @complete decorator is called when QML component is complete"""
         self.setup_message_capture()
 
-        class InitializableComponent:
-            def __init__(self):
-                self._initialized = False
-                self._init_count = 0
-
-            @property
-            def initialized(self) -> bool:
-                return self._initialized
-
-            @initialized.setter
-            def initialized(self, value: bool) -> None:
-                self._initialized = value
-
-            @property
-            def initCount(self) -> int:
-                return self._init_count
-
-            @complete
-            def componentComplete(self) -> None:
-                """This should be called automatically when QML component is complete"""
-                print(
-                    f"@complete: componentComplete called, count before: {self._init_count}",
-                    flush=True
-                )
-                self._initialized = True
-                self._init_count += 1
-                print(
-                    f"@complete: componentComplete finished, initialized={self._initialized}, "
-                    f"count={self._init_count}",
-                    flush=True
-                )
-
-            def getData(self) -> str:
-                """Return initialization status"""
-                return f"Initialized: {self._initialized}, Count: {self._init_count}"
-
-        # Register the type with bridge_type - use unique URI to avoid conflicts with other tests
-        bridge_type(InitializableComponent, uri="test.complete.basic", version="1.0")
-
         # Create QML that instantiates the component
         qml_content = """
         import QtQuick 2.15
@@ -648,87 +493,41 @@ class TestQAIMDecorators:
         }
         """
 
-        with tempfile.NamedTemporaryFile(mode='w', suffix='.qml', delete=False) as f:
-            f.write(qml_content)
-            temp_qml_path = f.name
-
-        try:
-            self.engine.load(QUrl.fromLocalFile(temp_qml_path))
-            qtbot.wait(200)  # Give time for component completion
-
-            # Capture stdout to check Python print statements
-            captured = capsys.readouterr()
-
-            # Check that @complete method was called via print output
-            assert '@complete: componentComplete called' in captured.out, (
-                f"Expected @complete method to be called. Captured output: {captured.out}"
-            )
-            assert '@complete: componentComplete finished' in captured.out, (
-                f"Expected @complete method to finish. Captured output: {captured.out}"
-            )
-
-            # Verify initialization happened via QML console output
-            qml_messages = [
-                msg for msg in self.captured_messages
-                if 'QML Component.onCompleted' in msg['message']
-            ]
-            assert len(qml_messages) >= 3, (
-                f"Expected at least 3 QML completion messages, got {len(qml_messages)}"
-            )
-
-            # Check that initialized property was set to true
-            initialized_true_msgs = [
-                msg for msg in self.captured_messages
-                if 'initialized: true' in msg['message'].lower()
-            ]
-            assert len(initialized_true_msgs) > 0, (
-                "Expected to see 'initialized: true' in QML output"
-            )
-
-        finally:
-            os.unlink(temp_qml_path)
-
-    def test_complete_decorator_with_property_updates(self, qtbot, capsys):
+        engine.loadData(qml_content.encode(), QUrl())
+        # The root object exists once component completion has run
+        qtbot.waitUntil(lambda: bool(engine.rootObjects()), timeout=2000)
+
+        # Capture stdout to check Python print statements
+        captured = capsys.readouterr()
+
+        # Check that @complete method was called via print output
+        assert '@complete: componentComplete called' in captured.out, (
+            f"Expected @complete method to be called. Captured output: {captured.out}"
+        )
+        assert '@complete: componentComplete finished' in captured.out, (
+            f"Expected @complete method to finish. Captured output: {captured.out}"
+        )
+
+        # Verify initialization happened via QML console output
+        qml_messages = [
+            msg for msg in self.captured_messages
+            if 'QML Component.onCompleted' in msg.message
+        ]
+        assert len(qml_messages) >= 3, (
+            f"Expected at least 3 QML completion messages, got {len(qml_messages)}"
+        )
+
+        # Check that initialized property was set to true, lowering the output only once
+        console_lower = "\n".join(msg.message for msg in self.captured_messages).lower()
+        assert 'initialized: true' in console_lower, (
+            "Expected to see 'initialized: true' in QML output"
+        )
+
+    @pytest.mark.usefixtures("complete_types")
+    def test_complete_decorator_with_property_updates(self, qtbot, engine, capsys):
         """Test that property changes in @complete methods trigger UI updates"""
         self.setup_message_capture()
 
-        class ServiceComponent:
-            def __init__(self):
-                self._ready = False
-                self._status = "Not initialized"
-
-            @property
-            def ready(self) -> bool:
-                return self._ready
-
-            @ready.setter
-            def ready(self, value: bool) -> None:
-                self._ready = value
-
-            @property
-            def status(self) -> str:
-                return self._status
-
-            @status.setter
-            def status(self, value: str) -> None:
-                self._status = value
-
-            @complete
-            def initialize(self) -> None:
-                """Initialize the service on component complete"""
-                print("@complete: Initializing service", flush=True)
-                self.ready = True
-                self.status = "Initialized and ready"
-                print(
-                    f"@complete: Service initialized, ready={self._ready}, status={self._status}",
-                    flush=True
-                )
-
-            def getInfo(self) -> str:
-                return f"Ready: {self._ready}, Status: {self._status}"
-
-        bridge_type(ServiceComponent, uri="test.complete.properties", version="1.0")
-
         qml_content = """
         import QtQuick 2.15
         import test.complete.properties 1.0
@@ -744,39 +543,26 @@ class TestQAIMDecorators:
         }
         """
 
-        with tempfile.NamedTemporaryFile(mode='w', suffix='.qml', delete=False) as f:
-            f.write(qml_content)
-            temp_qml_path = f.name
-
-        try:
-            self.engine.load(QUrl.fromLocalFile(temp_qml_path))
-            qtbot.wait(200)
-
-            # Capture stdout to check Python print statements
-            captured = capsys.readouterr()
-
-            # Verify @complete was called via stdout
-            assert '@complete: Initializing service' in captured.out, (
-                f"Expected @complete initialization message. Captured output: {captured.out}"
-            )
-            assert '@complete: Service initialized' in captured.out, (
-                f"Expected @complete completion message. Captured output: {captured.out}"
-            )
-
-            # Verify properties were updated via QML console output
-            ready_true_msgs = [
-                msg for msg in self.captured_messages
-                if 'ready: true' in msg['message'].lower()
-            ]
-            assert len(ready_true_msgs) > 0, "Expected to see 'ready: true' in QML output"
-
-            # Verify status was updated via QML console output
-            status_msgs = [
-                msg for msg in self.captured_messages
-                if 'Initialized and ready' in msg['message']
-            ]
-            assert len(status_msgs) > 0, "Expected to see updated status in QML output"
-
-        finally:
-            os.unlink(temp_qml_path)
+        engine.loadData(qml_content.encode(), QUrl())
+        qtbot.waitUntil(lambda: bool(engine.rootObjects()), timeout=2000)
+
+        # Capture stdout to check Python print statements
+        captured = capsys.readouterr()
+
+        # Verify @complete was called via stdout
+        assert '@complete: Initializing service' in captured.out, (
+            f"Expected @complete initialization message. Captured output: {captured.out}"
+        )
+        assert '@complete: Service initialized' in captured.out, (
+            f"Expected @complete completion message. Captured output: {captured.out}"
+        )
+
+        # Join the QML console output once for the checks below
+        console = "\n".join(msg.message for msg in self.captured_messages)
+
+        # Verify properties were updated via QML console output
+        assert 'ready: true' in console.lower(), "Expected to see 'ready: true' in QML output"
+
+        # Verify status was updated via QML console output
+        assert 'Initialized and ready' in console, "Expected to see updated status in QML output"
 